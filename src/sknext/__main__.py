@@ -1,6 +1,6 @@
 """Entry point for python -m sknext."""
 
-from sknext.cli import app
+from sknext.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -1,9 +1,13 @@
-"""Command-line interface using typer."""
+"""Command-line interface using argparse.
 
-from pathlib import Path
+argparse replaced typer here: typer pulls in click (and more) at import time,
+which dominated cold-start latency for a single-command CLI. Everything this
+tool needs - one optional positional, one counted option, five flags - is
+covered by stdlib argparse, and rich is only imported once output is needed.
+"""
 
-import typer
-from rich.console import Console
+import argparse
+from pathlib import Path
 
 from sknext.constants import DEFAULT_TASK_COUNT
 from sknext.discovery import discover_latest_tasks_file, find_repository_root
@@ -13,58 +17,61 @@ from sknext.formatter import (
     format_phases_only,
     format_structure_view,
     format_tasks_only,
+    get_console,
 )
 from sknext.parser import parse_tasks_file
 
-app = typer.Typer(
-    name="sknext",
-    help="Task status viewer for speckit projects",
-    add_completion=False,
-)
 
-
-@app.command()
-def main(
-    file_path: Path | None = typer.Argument(  # noqa: B008
-        None,
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the sknext command."""
+    parser = argparse.ArgumentParser(
+        prog="sknext",
+        description="Task status viewer for speckit projects",
+    )
+    parser.add_argument(
+        "file_path",
+        nargs="?",
+        type=Path,
+        default=None,
         help="Path to tasks.md file (auto-discovers if not provided)",
-        exists=True,
-        dir_okay=False,
-        readable=True,
-    ),
-    count: int = typer.Option(  # noqa: B008
-        DEFAULT_TASK_COUNT,
+    )
+    parser.add_argument(
         "-n",
         "--count",
+        type=int,
+        default=DEFAULT_TASK_COUNT,
         help="Number of tasks to display",
-        min=0,
-    ),
-    phases_only: bool = typer.Option(  # noqa: B008
-        False,
+    )
+    parser.add_argument(
         "--phases-only",
+        action="store_true",
         help="Show only phases with uncompleted work (no sections or tasks)",
-    ),
-    structure: bool = typer.Option(  # noqa: B008
-        False,
+    )
+    parser.add_argument(
         "--structure",
+        action="store_true",
         help="Show phases and sections with uncompleted work (no tasks)",
-    ),
-    all_phases: bool = typer.Option(  # noqa: B008
-        False,
+    )
+    parser.add_argument(
         "--all-phases",
+        action="store_true",
         help="Show all incomplete phases followed by next N tasks",
-    ),
-    tasks_only: bool = typer.Option(  # noqa: B008
-        False,
+    )
+    parser.add_argument(
         "--tasks-only",
+        action="store_true",
         help="Show only task lines without phase or section headings",
-    ),
-    all_tasks: bool = typer.Option(  # noqa: B008
-        False,
+    )
+    parser.add_argument(
         "--all",
+        dest="all_tasks",
+        action="store_true",
         help="Show all remaining tasks with full context (ignores -n)",
-    ),
-) -> None:
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
     """Display uncompleted tasks from a speckit tasks.md file.
 
     By default, shows the next 10 uncompleted tasks with their phase and section context.
@@ -75,8 +82,28 @@ def main(
     3. Loading its tasks.md file
 
     Works from any subdirectory within your project - no need to be at the root!
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
     """
-    console = Console()
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # Argument validation that typer previously handled declaratively;
+    # parser.error writes to stderr and exits with code 2
+    if args.count < 0:
+        parser.error("-n/--count must be >= 0")
+
+    file_path: Path | None = args.file_path
+    if file_path is not None:
+        if not file_path.exists():
+            parser.error(f"file {file_path} does not exist")
+        if file_path.is_dir():
+            parser.error(f"{file_path} is a directory, not a file")
+
+    # Shared lazily-created console; rich is only imported past this point,
+    # so --help and argument errors never pay for it
+    console = get_console()
 
     try:
         # Auto-discover if no path provided
@@ -91,14 +118,14 @@ def main(
                     "Run from a project directory or specify file path explicitly:\n"
                     "  [dim]sknext /path/to/tasks.md[/dim]"
                 )
-                raise typer.Exit(code=1)
+                raise SystemExit(1)
 
             try:
                 file_path = discover_latest_tasks_file(repo_root)
                 console.print(f"[dim]Found: {file_path}[/dim]\n")
             except FileNotFoundError as e:
                 console.print(f"[bold red]Error:[/bold red] {e}")
-                raise typer.Exit(code=1) from None
+                raise SystemExit(1) from None
 
         # Parse the file
         tasks_file = parse_tasks_file(file_path)
@@ -109,33 +136,33 @@ def main(
             for error in tasks_file.parse_errors:
                 console.print(f"  Line {error.line_number}: {error.error_type} - {error.message}")
                 console.print(f"  [dim]{error.line_content}[/dim]")
-            raise typer.Exit(code=2)
+            raise SystemExit(2)
 
         # Format and display based on view mode
-        if phases_only:
+        if args.phases_only:
             format_phases_only(console, tasks_file)
-        elif structure:
+        elif args.structure:
             format_structure_view(console, tasks_file)
-        elif all_phases:
-            format_combined_view(console, tasks_file, count)
-        elif tasks_only:
-            format_tasks_only(console, tasks_file, count)
-        elif all_tasks:
+        elif args.all_phases:
+            format_combined_view(console, tasks_file, args.count)
+        elif args.tasks_only:
+            format_tasks_only(console, tasks_file, args.count)
+        elif args.all_tasks:
             # Show all tasks with context (use large count)
             format_default_view(console, tasks_file, count=99999)
         else:
-            format_default_view(console, tasks_file, count)
+            format_default_view(console, tasks_file, args.count)
 
     except FileNotFoundError as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
-        raise typer.Exit(code=1) from None
-    except (typer.Exit, typer.Abort):
-        # Let typer control flow exceptions propagate
+        raise SystemExit(1) from None
+    except SystemExit:
+        # Let exit codes set above propagate
         raise
     except Exception as e:
         console.print(f"[bold red]Unexpected error:[/bold red] {e}")
-        raise typer.Exit(code=3) from None
+        raise SystemExit(3) from None
 
 
 if __name__ == "__main__":
-    app()
+    main()
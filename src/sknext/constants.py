@@ -1,14 +1,49 @@
-"""Constants and regex patterns for parsing tasks.md files."""
+"""Constants and regex patterns for parsing tasks.md files.
+
+Regex patterns are compiled lazily via module-level ``__getattr__`` (PEP 562):
+``from sknext.constants import PHASE_PATTERN`` still works, but compilation is
+deferred until a pattern is first accessed instead of paid at import time.
+
+Each pattern also has a ``*_BYTES`` variant (e.g. ``TASK_PATTERN_BYTES``)
+compiled from the same source against bytes, so the parser can match directly
+on a memory-mapped buffer and defer UTF-8 decoding to matched lines only.
+"""
 
 import re
+from typing import Any
 
 # Display constants
 DEFAULT_TASK_COUNT = 10
 MAX_NESTING_DEPTH = 5
 
-# Regex patterns for parsing
-PHASE_PATTERN = re.compile(r"^## Phase (?P<number>\d+):\s*(?P<title>.+)$")
+# Regex sources, compiled on first attribute access
+# Title/description groups are anchored as \S(?:.*\S)? with surrounding \s*
+# so captures come back already trimmed and the parser needs no .strip()
+_PATTERN_SOURCES = {
+    "PHASE_PATTERN": r"^## Phase (?P<number>\d+):\s*(?P<title>\S(?:.*\S)?)\s*$",
+    "SECTION_PATTERN": r"^(?P<level>#{3,})\s+(?P<title>\S(?:.*\S)?)\s*$",
+    "TASK_PATTERN": (
+        r"^-\s+\[(?P<checkbox>.)\]\s+(?P<task_id>T\d{3,})\s+(?P<description>\S(?:.*\S)?)\s*$"
+    ),
+    "STORY_TAG_PATTERN": r"\[US(?P<story>\d+)\]",
+    # Fused alternation of the three line shapes above so the parser enters
+    # the regex engine once per line; group names are prefixed to stay unique.
+    # Branch order mirrors the parser's original match order (phase wins over
+    # section for "## Phase..." lines because sections need 3+ hashes).
+    "LINE_PATTERN": (
+        r"^(?:## Phase (?P<phase_number>\d+):\s*(?P<phase_title>\S(?:.*\S)?)"
+        r"|(?P<section_level>#{3,})\s+(?P<section_title>\S(?:.*\S)?)"
+        r"|-\s+\[(?P<checkbox>.)\]\s+(?P<task_id>T\d{3,})\s+(?P<description>\S(?:.*\S)?))"
+        r"\s*$"
+    ),
+}
 
-SECTION_PATTERN = re.compile(r"^(?P<level>#{3,})\s+(?P<title>.+)$")
 
-TASK_PATTERN = re.compile(r"^-\s+\[(?P<checkbox>.)\]\s+(?P<task_id>T\d{3,})\s+(?P<description>.+)$")
+def __getattr__(name: str) -> Any:
+    base_name = name.removesuffix("_BYTES")
+    source = _PATTERN_SOURCES.get(base_name)
+    if source is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pattern = re.compile(source.encode("ascii") if name.endswith("_BYTES") else source)
+    globals()[name] = pattern  # cache so __getattr__ only fires once per pattern
+    return pattern
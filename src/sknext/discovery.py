@@ -8,16 +8,65 @@ Performance characteristics:
 - Combined with file discovery: <2s total execution time
 
 Optimization strategies:
-- Git command preferred (single syscall, no traversal)
-- Early termination on first match (git → vcs → specs)
+- VCS marker walk first (cached scandir probes, no subprocess)
+- Early termination on first match (marker walk → git → fused vcs/specs walk)
 - Max 10 levels prevents excessive filesystem traversal
-- 2s timeout on git command prevents network filesystem hangs
+- 0.5s timeout on git command prevents network filesystem hangs
+- Per-path caches across every layer; see clear_discovery_caches()
 """
 
-import re
+import os
 import subprocess
+import time
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
+# VCS marker names checked during parent-directory walks
+_VCS_MARKERS = frozenset({".git", ".hg", ".svn"})
+
+# Per-path results of find_git_root; one git fork per distinct start path
+# per process instead of one per call
+_GIT_ROOT_CACHE: dict[Path, Path | None] = {}
+
+# Ancestor-chain caches for the filesystem walks: when a root is found, every
+# directory visited on the way up maps to it, so a later lookup from any
+# descendant of a known root returns without touching the filesystem.
+# Only successes are cached here; failed walks are already cheap to repeat
+# because the per-directory marker probe below is lru_cached.
+_VCS_ROOT_CACHE: dict[str, Path] = {}
+_SPECS_ROOT_CACHE: dict[str, Path] = {}
+
+# Memoized find_repository_root answers: (monotonic timestamp, result).
+# Short-lived CLI runs never expire entries; long-running hosts can pass a
+# TTL to pick up repository changes.
+_REPO_ROOT_CACHE: dict[str, tuple[float, Path | None]] = {}
+
+# Successful discover_latest_tasks_file answers keyed by specs dir, each
+# fingerprinted with the directory's mtime: adding/removing/renaming a
+# feature dir bumps it, so hits are validated with one stat instead of a TTL
+_LATEST_TASKS_CACHE: dict[str, tuple[int, Path]] = {}
+
+
+def clear_git_root_cache() -> None:
+    """Clear the cached git-root lookups (primarily for tests)."""
+    _GIT_ROOT_CACHE.clear()
+
+
+def clear_repository_root_cache() -> None:
+    """Clear memoized find_repository_root results (tests, long-lived hosts)."""
+    _REPO_ROOT_CACHE.clear()
+
+
+def clear_discovery_caches() -> None:
+    """Reset every discovery-level cache (primarily for tests)."""
+    _GIT_ROOT_CACHE.clear()
+    _VCS_ROOT_CACHE.clear()
+    _SPECS_ROOT_CACHE.clear()
+    _REPO_ROOT_CACHE.clear()
+    _LATEST_TASKS_CACHE.clear()
+    _has_vcs_marker.cache_clear()
+
 
 def find_git_root(start_path: Path) -> Path | None:
     """Use git command to find repository root.
@@ -34,20 +83,70 @@ def find_git_root(start_path: Path) -> Path | None:
         Path to git repository root, or None if:
         - Not in a git repository
         - Git not installed
-        - Command times out (network filesystem)
+        On timeout (network filesystem) the ancestor marker walk answers
+        instead, so a root may still be returned without git finishing.
+
+    Results (including failures) are cached per resolved start path, so
+    repeated lookups in one process spawn git at most once.
     """
+    key = start_path.resolve()
+    if key in _GIT_ROOT_CACHE:
+        return _GIT_ROOT_CACHE[key]
+
     try:
+        # stderr goes to DEVNULL (never read) and stdout stays as bytes:
+        # no second pipe and no blanket text-mode decode of the output.
+        # The success path is sub-10ms, so 0.5s comfortably bounds the wait
+        # on pathological setups (stale NFS, antivirus-throttled git)
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
             cwd=start_path,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=True,
-            timeout=2.0,  # Prevent hanging on network filesystems
+            timeout=0.5,
         )
-        return Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return None
+        root: Path | None = Path(os.fsdecode(result.stdout).strip())
+    except subprocess.TimeoutExpired:
+        # git hung, but a .git marker on the ancestor chain is still a good
+        # answer; the walk costs microseconds against a warm dentry cache
+        root = find_vcs_root_filesystem(start_path)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        root = None
+
+    _GIT_ROOT_CACHE[key] = root
+    return root
+
+
+def _iter_ancestors(start_path: Path, max_levels: int) -> Iterator[str]:
+    """Yield up to max_levels ancestors of start_path as absolute strings.
+
+    Shared by every upward-walk helper so the dirname stepping and
+    root-of-filesystem termination live in one place. Strings, not Paths:
+    each Path.parent would allocate and re-parse a PurePath per level.
+    """
+    current = os.fspath(start_path.absolute())
+    for _ in range(max_levels):
+        yield current
+        parent = os.path.dirname(current)
+        if parent == current:  # Reached filesystem root
+            break
+        current = parent
+
+
+@lru_cache(maxsize=128)
+def _has_vcs_marker(path_str: str) -> bool:
+    """Return True if the directory directly contains a VCS marker.
+
+    One scandir per directory instead of one exists() stat per marker, and
+    cached so repeated walks over the same ancestor chain (tests, repeated
+    CLI invocations in one process) skip the syscalls entirely.
+    """
+    try:
+        with os.scandir(path_str) as entries:
+            return any(entry.name in _VCS_MARKERS for entry in entries)
+    except OSError:
+        return False
 
 
 def find_vcs_root_filesystem(start_path: Path, max_levels: int = 10) -> Path | None:
@@ -63,18 +162,21 @@ def find_vcs_root_filesystem(start_path: Path, max_levels: int = 10) -> Path | N
     Returns:
         Path to directory containing VCS marker, or None if not found
     """
-    VCS_MARKERS = [".git", ".hg", ".svn"]
-    current = start_path.resolve()  # Resolve symlinks once (~1-5ms)
-
-    for _ in range(max_levels):
-        for marker in VCS_MARKERS:
-            if (current / marker).exists():  # Works for both files and dirs
-                return current
-
-        parent = current.parent
-        if parent == current:  # Reached filesystem root
-            break
-        current = parent
+    cached = _VCS_ROOT_CACHE.get(os.fspath(start_path.absolute()))
+    if cached is not None:
+        return cached
+
+    visited: list[str] = []
+    for current in _iter_ancestors(start_path, max_levels):
+        if _has_vcs_marker(current):  # Works for both files and dirs
+            root = Path(current)
+            # Every directory walked through resolves to this root
+            for path in visited:
+                _VCS_ROOT_CACHE[path] = root
+            _VCS_ROOT_CACHE[current] = root
+            return root
+
+        visited.append(current)
 
     return None
 
@@ -89,46 +191,129 @@ def find_specs_root(start_path: Path, max_levels: int = 10) -> Path | None:
     Returns:
         Path to directory containing specs/ subdirectory, or None if not found
     """
-    current = start_path.resolve()
+    cached = _SPECS_ROOT_CACHE.get(os.fspath(start_path.absolute()))
+    if cached is not None:
+        return cached
+
+    visited: list[str] = []
+    for current in _iter_ancestors(start_path, max_levels):
+        # One scandir per level instead of a stat on the joined path;
+        # DirEntry.is_dir reuses the d_type from the directory read
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name == "specs" and entry.is_dir(follow_symlinks=False):
+                        root = Path(current)
+                        for path in visited:
+                            _SPECS_ROOT_CACHE[path] = root
+                        _SPECS_ROOT_CACHE[current] = root
+                        return root
+        except OSError:
+            pass
+
+        visited.append(current)
 
-    for _ in range(max_levels):
-        if (current / "specs").is_dir():
-            return current
+    return None
 
-        parent = current.parent
-        if parent == current:
-            break
-        current = parent
+
+def find_any_root(start_path: Path, max_levels: int = 10) -> Path | None:
+    """Search parent directories for either a VCS marker or a specs/ folder.
+
+    Fuses the VCS and specs/ walks into a single pass: one scandir per level
+    checks both marker sets, so the non-git fallback does half the traversals
+    of running find_vcs_root_filesystem and find_specs_root back to back.
+
+    Args:
+        start_path: Directory to start searching from
+        max_levels: Maximum parent directories to check (default: 10)
+
+    Returns:
+        Path to the first directory containing a VCS marker or specs/
+        subdirectory, or None if not found
+    """
+    for current in _iter_ancestors(start_path, max_levels):
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name in _VCS_MARKERS:
+                        return Path(current)
+                    if entry.name == "specs" and entry.is_dir(follow_symlinks=False):
+                        return Path(current)
+        except OSError:
+            pass
 
     return None
 
 
-def find_repository_root(start_path: Path) -> Path | None:
+def find_repository_root(start_path: Path, ttl_seconds: float | None = None) -> Path | None:
     """Find repository root by trying multiple detection methods.
 
     Tries in order:
-    1. Git command (fast, handles worktrees)
-    2. VCS marker search (.git, .hg, .svn)
-    3. specs/ directory search (non-VCS fallback)
+    1. VCS marker probe up the ancestor chain (no subprocess)
+    2. Git command (handles checkouts the marker walk cannot see)
+    3. Fused walk for VCS markers or specs/ directory (non-git fallback)
+
+    Results are memoized per start path. A one-shot CLI run never needs
+    expiry; long-running callers can pass ``ttl_seconds`` to re-detect after
+    the entry ages out.
+
+    Wrappers that already know the answer (pre-commit hooks, CI scripts,
+    editor plugins) can export ``SKNEXT_REPO_ROOT`` to skip detection -
+    including the git subprocess - entirely.
 
     Args:
         start_path: Directory to start searching from
+        ttl_seconds: Maximum age of a cached answer, or None to cache forever
 
     Returns:
         Path to repository root, or None if not found within 10 levels
     """
-    # Try git command first (fastest)
+    env_root = os.environ.get("SKNEXT_REPO_ROOT")
+    if env_root:
+        env_path = Path(env_root)
+        if env_path.is_dir():
+            return env_path
+
+    key = os.fspath(start_path.absolute())
+    entry = _REPO_ROOT_CACHE.get(key)
+    if entry is not None:
+        cached_at, cached_root = entry
+        if ttl_seconds is None or time.monotonic() - cached_at <= ttl_seconds:
+            return cached_root
+
+    root = _detect_repository_root(start_path)
+    _REPO_ROOT_CACHE[key] = (time.monotonic(), root)
+    return root
+
+
+def _detect_repository_root(start_path: Path) -> Path | None:
+    """Run the uncached detection chain for find_repository_root."""
+    # Marker probe first: in the overwhelmingly common in-repo case this
+    # answers from (cached) scandir calls and skips the git fork/exec
+    # entirely. A .git *file* (worktree) still marks the worktree root.
+    marker_root = find_vcs_root_filesystem(start_path)
+    if marker_root:
+        return marker_root
+
+    # Fall back to the git command for anything the walk missed (e.g.
+    # GIT_DIR environments or CWDs more than 10 levels deep in a checkout)
     git_root = find_git_root(start_path)
     if git_root:
         return git_root
 
-    # Fallback to VCS marker search
-    vcs_root = find_vcs_root_filesystem(start_path)
-    if vcs_root:
-        return vcs_root
+    # Fallback: single walk checking VCS markers and specs/ together
+    return find_any_root(start_path)
+
 
-    # Final fallback: search for specs/ directory
-    return find_specs_root(start_path)
+@lru_cache(maxsize=4096)
+def _numeric_prefix(name: str) -> int | None:
+    """Return the leading ``NNN-`` prefix of a feature dir name, or None.
+
+    Cached: the same directory names are re-split on every discovery call in
+    a process, and plain string keys are safe across workspaces.
+    """
+    head = name.partition("-")[0]
+    return int(head) if head.isdigit() and head != name else None
 
 
 def discover_latest_tasks_file(workspace_root: Path) -> Path:
@@ -148,32 +333,47 @@ def discover_latest_tasks_file(workspace_root: Path) -> Path:
     """
     specs_dir = workspace_root / "specs"
 
-    if not specs_dir.exists():
-        raise FileNotFoundError(f"No specs/ directory found in {workspace_root}")
-
-    # Find all directories with numeric prefix pattern (###-*)
-    feature_dirs = []
-    for item in specs_dir.iterdir():
-        if not item.is_dir():
-            continue
-
-        # Extract numeric prefix
-        match = re.match(r"^(\d+)-", item.name)
-        if match:
-            number = int(match.group(1))
-            feature_dirs.append((number, item))
-
-    if not feature_dirs:
+    # The stat doubles as the existence check and as the cache fingerprint:
+    # any entry added/removed/renamed under specs/ bumps the directory mtime,
+    # so a matching fingerprint validates a cached answer with one syscall
+    try:
+        specs_mtime = os.stat(specs_dir).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"No specs/ directory found in {workspace_root}") from None
+
+    cache_key = os.fspath(specs_dir)
+    cached = _LATEST_TASKS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == specs_mtime:
+        return cached[1]
+
+    # Find the directory with the highest numeric prefix (###-*) in a single
+    # pass: track the running max instead of collecting and sorting a list.
+    # os.scandir is used instead of iterdir: DirEntry.is_dir() reuses the
+    # d_type from the directory read, avoiding a stat syscall per entry
+    best_number = -1
+    latest_path: str | None = None
+    with os.scandir(specs_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            # Extract numeric prefix ("001-feature" -> 1); plain string ops
+            # beat the regex engine for this simple shape
+            number = _numeric_prefix(entry.name)
+            if number is not None and number > best_number:
+                best_number = number
+                latest_path = entry.path
+
+    if latest_path is None:
         raise FileNotFoundError(
             f"No feature directories found in {specs_dir} (expected format: ###-name)"
         )
 
-    # Sort by number and get highest
-    feature_dirs.sort(key=lambda x: x[0], reverse=True)
-    latest_dir = feature_dirs[0][1]
-
-    tasks_file = latest_dir / "tasks.md"
-    if not tasks_file.exists():
-        raise FileNotFoundError(f"No tasks.md found in {latest_dir}")
+    # One isfile syscall on the joined string; only the final result is
+    # wrapped in a Path
+    if not os.path.isfile(os.path.join(latest_path, "tasks.md")):
+        raise FileNotFoundError(f"No tasks.md found in {Path(latest_path)}")
 
+    tasks_file = Path(latest_path) / "tasks.md"
+    _LATEST_TASKS_CACHE[cache_key] = (specs_mtime, tasks_file)
     return tasks_file
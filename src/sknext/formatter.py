@@ -1,11 +1,33 @@
-"""Output formatting with rich console."""
+"""Output formatting with rich console.
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+Rich imports are deferred into the formatter bodies: they account for most of
+CLI startup time and are never needed for --help or shell completion.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
 
 from sknext.models import Phase, Section, Task, TasksFile
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def get_console() -> Console:
+    """Return the shared Console instance, created on first use.
+
+    Console() probes the terminal (isatty, size lookup) on every
+    construction; caching the instance pays that cost once per process,
+    which matters when the CLI entry point is invoked repeatedly in-process
+    (tests) and is neutral for a normal single run.
+    """
+    from rich.console import Console
+
+    return Console()
+
 
 def format_default_view(console: Console, tasks_file: TasksFile, count: int) -> None:
     """Format and display the default view: next N uncompleted tasks with context.
@@ -15,9 +37,9 @@ def format_default_view(console: Console, tasks_file: TasksFile, count: int) ->
         tasks_file: Parsed tasks file
         count: Number of tasks to display
     """
-    uncompleted_tasks = tasks_file.get_uncompleted_tasks()
+    from rich.panel import Panel
 
-    if not uncompleted_tasks:
+    if tasks_file.is_complete():
         console.print(
             Panel.fit(
                 "[bold green]✓ All tasks complete![/bold green]",
@@ -28,67 +50,55 @@ def format_default_view(console: Console, tasks_file: TasksFile, count: int) ->
 
     # Easter Egg: If count=0 but tasks exist, show 1 task with humorous message
     if count == 0:
-        tasks_to_show = uncompleted_tasks[:1]
+        tasks_to_show = tasks_file.get_uncompleted_tasks(limit=1)
         easter_egg_message = True
     else:
-        # Take first N tasks
-        tasks_to_show = uncompleted_tasks[:count]
+        # Take first N tasks; the limit avoids materializing the full list
+        tasks_to_show = tasks_file.get_uncompleted_tasks(limit=count)
         easter_egg_message = False
 
-    total_remaining = len(uncompleted_tasks)
+    total_remaining = sum(phase.uncompleted_task_count() for phase in tasks_file.phases)
 
-    # Build output with hierarchical context
+    # Build output with hierarchical context; lines are accumulated and
+    # printed in one call so rich renders (and stdout receives) one batch
+    # instead of one write per task
+    lines: list[str] = []
     current_phase: Phase | None = None
     current_section: Section | None = None
 
     for task in tasks_to_show:
         # Find which phase and section this task belongs to
-        task_phase, task_section = _find_task_context(tasks_file, task)
+        task_phase, task_section = tasks_file.get_task_context(task)
 
         # Show phase heading if changed
         if task_phase != current_phase:
-            console.print()
-            console.print(
-                f"[bold cyan]## Phase {task_phase.number}: {task_phase.title}[/bold cyan]"
-            )
+            lines.append("")
+            lines.append(f"[bold cyan]## Phase {task_phase.number}: {task_phase.title}[/bold cyan]")
             current_phase = task_phase
             current_section = None
 
         # Show section heading if changed (skip if empty title - implicit section)
         if task_section != current_section:
             if task_section.title:  # Only show section if it has a title
-                console.print()
-                console.print(f"[bold]{'#' * task_section.level} {task_section.title}[/bold]")
+                lines.append("")
+                lines.append(f"[bold]{'#' * task_section.level} {task_section.title}[/bold]")
             current_section = task_section
 
         # Show task
-        task_text = Text()
-        task_text.append("- [ ] ", style="dim")
-        task_text.append(f"{task.id} ", style="yellow")
-
-        # Highlight priority and story tags
-        desc = task.description
-        if "[P]" in desc:
-            desc = desc.replace("[P]", "")
-            task_text.append("[P] ", style="bold magenta")
-
-        if task.story_tag:
-            desc = desc.replace(f"[{task.story_tag}]", "")
-            task_text.append(f"[{task.story_tag}] ", style="bold blue")
-
-        task_text.append(desc.strip())
-        console.print(task_text)
+        lines.append(_render_task(task))
 
     # Show summary
-    console.print()
+    lines.append("")
     if easter_egg_message:
-        console.print("[dim]Showing 0 tasks (for VERY large values of zero)[/dim]")
+        lines.append("[dim]Showing 0 tasks (for VERY large values of zero)[/dim]")
     elif len(tasks_to_show) < total_remaining:
-        console.print(
+        lines.append(
             f"[dim]Showing {len(tasks_to_show)} of {total_remaining} remaining tasks[/dim]"
         )
     else:
-        console.print(f"[dim]Showing all {total_remaining} remaining tasks[/dim]")
+        lines.append(f"[dim]Showing all {total_remaining} remaining tasks[/dim]")
+
+    console.print("\n".join(lines), highlight=False)
 
 
 def format_phases_only(console: Console, tasks_file: TasksFile) -> None:
@@ -98,6 +108,8 @@ def format_phases_only(console: Console, tasks_file: TasksFile) -> None:
         console: Rich console for output
         tasks_file: Parsed tasks file
     """
+    from rich.panel import Panel
+
     # Filter to phases with uncompleted work
     phases_with_work = [phase for phase in tasks_file.phases if phase.has_uncompleted_work()]
 
@@ -110,16 +122,16 @@ def format_phases_only(console: Console, tasks_file: TasksFile) -> None:
         )
         return
 
-    # Display each phase heading only
-    console.print("[bold]Phases with uncompleted work:[/bold]")
-    console.print()
+    # Display each phase heading only, batched into a single print
+    lines: list[str] = ["[bold]Phases with uncompleted work:[/bold]", ""]
 
     for phase in phases_with_work:
-        console.print(f"[bold cyan]## Phase {phase.number}: {phase.title}[/bold cyan]")
+        lines.append(f"[bold cyan]## Phase {phase.number}: {phase.title}[/bold cyan]")
 
     # Show summary
-    console.print()
-    console.print(f"[dim]Showing {len(phases_with_work)} of {len(tasks_file.phases)} phases[/dim]")
+    lines.append("")
+    lines.append(f"[dim]Showing {len(phases_with_work)} of {len(tasks_file.phases)} phases[/dim]")
+    console.print("\n".join(lines), highlight=False)
 
 
 def format_structure_view(console: Console, tasks_file: TasksFile) -> None:
@@ -129,6 +141,8 @@ def format_structure_view(console: Console, tasks_file: TasksFile) -> None:
         console: Rich console for output
         tasks_file: Parsed tasks file
     """
+    from rich.panel import Panel
+
     # Filter to phases with uncompleted work
     phases_with_work = [phase for phase in tasks_file.phases if phase.has_uncompleted_work()]
 
@@ -141,28 +155,26 @@ def format_structure_view(console: Console, tasks_file: TasksFile) -> None:
         )
         return
 
-    # Display phases and their sections (but not tasks)
-    console.print("[bold]Project structure with uncompleted work:[/bold]")
-    console.print()
+    # Display phases and their sections (but not tasks), batched into one print
+    lines: list[str] = ["[bold]Project structure with uncompleted work:[/bold]", ""]
 
     section_count = 0
     for phase in phases_with_work:
-        console.print(f"[bold cyan]## Phase {phase.number}: {phase.title}[/bold cyan]")
+        lines.append(f"[bold cyan]## Phase {phase.number}: {phase.title}[/bold cyan]")
 
         # Show only sections with uncompleted work
         for section in phase.sections:
             if section.has_uncompleted_tasks():
                 # Skip implicit sections (empty title)
                 if section.title:
-                    console.print(f"  [bold]{'#' * section.level} {section.title}[/bold]")
+                    lines.append(f"  [bold]{'#' * section.level} {section.title}[/bold]")
                     section_count += 1
 
-        console.print()
+        lines.append("")
 
     # Show summary
-    console.print(
-        f"[dim]Showing {len(phases_with_work)} phases with {section_count} sections[/dim]"
-    )
+    lines.append(f"[dim]Showing {len(phases_with_work)} phases with {section_count} sections[/dim]")
+    console.print("\n".join(lines), highlight=False)
 
 
 def format_combined_view(console: Console, tasks_file: TasksFile, count: int) -> None:
@@ -173,9 +185,9 @@ def format_combined_view(console: Console, tasks_file: TasksFile, count: int) ->
         tasks_file: Parsed tasks file
         count: Number of tasks to display
     """
-    uncompleted_tasks = tasks_file.get_uncompleted_tasks()
+    from rich.panel import Panel
 
-    if not uncompleted_tasks:
+    if tasks_file.is_complete():
         console.print(
             Panel.fit(
                 "[bold green]✓ All tasks complete![/bold green]",
@@ -184,80 +196,66 @@ def format_combined_view(console: Console, tasks_file: TasksFile, count: int) ->
         )
         return
 
+    total_remaining = sum(phase.uncompleted_task_count() for phase in tasks_file.phases)
+
     # Section 1: Show all incomplete phases
     phases_with_work = [phase for phase in tasks_file.phases if phase.has_uncompleted_work()]
 
-    console.print("[bold]Incomplete phases:[/bold]")
-    console.print()
+    lines: list[str] = ["[bold]Incomplete phases:[/bold]", ""]
 
     for phase in phases_with_work:
-        console.print(f"[bold cyan]## Phase {phase.number}: {phase.title}[/bold cyan]")
+        lines.append(f"[bold cyan]## Phase {phase.number}: {phase.title}[/bold cyan]")
 
     # Separator
-    console.print()
-    console.print("[dim]" + "─" * 60 + "[/dim]")
-    console.print()
+    lines.append("")
+    lines.append("[dim]" + "─" * 60 + "[/dim]")
+    lines.append("")
 
     # Section 2: Show next N tasks with context
-    console.print(f"[bold]Next {min(count, len(uncompleted_tasks))} tasks:[/bold]")
-    console.print()
+    lines.append(f"[bold]Next {min(count, total_remaining)} tasks:[/bold]")
+    lines.append("")
 
-    tasks_to_show = uncompleted_tasks[:count]
+    # The limit avoids materializing the full uncompleted list
+    tasks_to_show = tasks_file.get_uncompleted_tasks(limit=count)
     current_phase: Phase | None = None
     current_section: Section | None = None
 
     for task in tasks_to_show:
         # Find which phase and section this task belongs to
-        task_phase, task_section = _find_task_context(tasks_file, task)
+        task_phase, task_section = tasks_file.get_task_context(task)
 
         # Show phase heading if changed
         if task_phase != current_phase:
-            console.print()
-            console.print(
-                f"[bold cyan]## Phase {task_phase.number}: {task_phase.title}[/bold cyan]"
-            )
+            lines.append("")
+            lines.append(f"[bold cyan]## Phase {task_phase.number}: {task_phase.title}[/bold cyan]")
             current_phase = task_phase
             current_section = None
 
         # Show section heading if changed (skip if empty title)
         if task_section != current_section:
             if task_section.title:
-                console.print()
-                console.print(f"[bold]{'#' * task_section.level} {task_section.title}[/bold]")
+                lines.append("")
+                lines.append(f"[bold]{'#' * task_section.level} {task_section.title}[/bold]")
             current_section = task_section
 
         # Show task
-        task_text = Text()
-        task_text.append("- [ ] ", style="dim")
-        task_text.append(f"{task.id} ", style="yellow")
-
-        # Highlight priority and story tags
-        desc = task.description
-        if "[P]" in desc:
-            desc = desc.replace("[P]", "")
-            task_text.append("[P] ", style="bold magenta")
-
-        if task.story_tag:
-            desc = desc.replace(f"[{task.story_tag}]", "")
-            task_text.append(f"[{task.story_tag}] ", style="bold blue")
-
-        task_text.append(desc.strip())
-        console.print(task_text)
+        lines.append(_render_task(task))
 
     # Show summary
-    console.print()
-    total_remaining = len(uncompleted_tasks)
+    lines.append("")
     if len(tasks_to_show) < total_remaining:
-        console.print(
+        lines.append(
             f"[dim]Showing {len(phases_with_work)} phases and "
             f"{len(tasks_to_show)} of {total_remaining} remaining tasks[/dim]"
         )
     else:
-        console.print(
+        lines.append(
             f"[dim]Showing {len(phases_with_work)} phases and "
             f"all {total_remaining} remaining tasks[/dim]"
         )
 
+    console.print("\n".join(lines), highlight=False)
+
 
 def format_tasks_only(console: Console, tasks_file: TasksFile, count: int) -> None:
     """Format and display tasks-only view: task lines without any headings.
@@ -267,9 +265,9 @@ def format_tasks_only(console: Console, tasks_file: TasksFile, count: int) -> No
         tasks_file: Parsed tasks file
         count: Number of tasks to display
     """
-    uncompleted_tasks = tasks_file.get_uncompleted_tasks()
+    from rich.panel import Panel
 
-    if not uncompleted_tasks:
+    if tasks_file.is_complete():
         console.print(
             Panel.fit(
                 "[bold green]✓ All tasks complete![/bold green]",
@@ -278,53 +276,46 @@ def format_tasks_only(console: Console, tasks_file: TasksFile, count: int) -> No
         )
         return
 
-    # Show tasks without any phase/section context
-    tasks_to_show = uncompleted_tasks[:count]
-
-    for task in tasks_to_show:
-        task_text = Text()
-        task_text.append("- [ ] ", style="dim")
-        task_text.append(f"{task.id} ", style="yellow")
-
-        # Highlight priority and story tags
-        desc = task.description
-        if "[P]" in desc:
-            desc = desc.replace("[P]", "")
-            task_text.append("[P] ", style="bold magenta")
+    # Show tasks without any phase/section context, batched into one print;
+    # the limit avoids materializing the full uncompleted list
+    tasks_to_show = tasks_file.get_uncompleted_tasks(limit=count)
 
-        if task.story_tag:
-            desc = desc.replace(f"[{task.story_tag}]", "")
-            task_text.append(f"[{task.story_tag}] ", style="bold blue")
-
-        task_text.append(desc.strip())
-        console.print(task_text)
+    lines: list[str] = [_render_task(task) for task in tasks_to_show]
 
     # Show summary
-    console.print()
-    total_remaining = len(uncompleted_tasks)
+    lines.append("")
+    total_remaining = sum(phase.uncompleted_task_count() for phase in tasks_file.phases)
     if len(tasks_to_show) < total_remaining:
-        console.print(
+        lines.append(
             f"[dim]Showing {len(tasks_to_show)} of {total_remaining} remaining tasks[/dim]"
         )
     else:
-        console.print(f"[dim]Showing all {total_remaining} remaining tasks[/dim]")
+        lines.append(f"[dim]Showing all {total_remaining} remaining tasks[/dim]")
+
+    console.print("\n".join(lines), highlight=False)
+
 
+def _render_task(task: Task) -> str:
+    """Render a task line as a single rich-markup string.
 
-def _find_task_context(tasks_file: TasksFile, target_task: Task) -> tuple[Phase, Section]:
-    """Find which phase and section a task belongs to.
+    One markup string per task avoids the Text-object churn of building each
+    line from 3-5 append() calls, which dominates for --all on large files.
 
     Args:
-        tasks_file: The parsed tasks file
-        target_task: The task to find context for
+        task: The task to render
 
     Returns:
-        Tuple of (Phase, Section) containing the task
+        Rich markup string for the task line
     """
-    for phase in tasks_file.phases:
-        for section in phase.sections:
-            for task in section.tasks:
-                if task.id == target_task.id and task.line_number == target_task.line_number:
-                    return (phase, section)
+    from rich.markup import escape
+
+    prefix = "[dim]- [ ][/dim] [yellow]" + task.id + "[/yellow] "
+
+    # Highlight priority and story tags; marker stripping happened at parse time
+    if task.priority:
+        prefix += "[bold magenta][P][/bold magenta] "
+
+    if task.story_tag:
+        prefix += f"[bold blue][{task.story_tag}][/bold blue] "
 
-    # Should never reach here if task came from tasks_file
-    raise ValueError(f"Task {target_task.id} not found in tasks file")
+    return prefix + escape(task.description_clean)
@@ -1,10 +1,12 @@
 """Data models for task file structure."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task:
     """Represents a single work item with completion status and metadata.
 
@@ -15,7 +17,8 @@ class Task:
         priority: True if [P] marker present
         story_tag: Story identifier if present (e.g., "US1", "US2")
         line_number: Source line number for error reporting
-        raw_line: Original line text for debugging
+        description_clean: Description with [P] and story-tag markers stripped,
+            computed once at construction so formatters avoid re-scanning
     """
 
     id: str
@@ -24,10 +27,19 @@ class Task:
     priority: bool
     story_tag: str | None
     line_number: int
-    raw_line: str
+    description_clean: str = field(init=False, compare=False, repr=False)
 
+    def __post_init__(self) -> None:
+        desc = self.description
+        if "[P]" in desc:
+            desc = desc.replace("[P]", "")
+        if self.story_tag:
+            desc = desc.replace(f"[{self.story_tag}]", "")
+        # frozen=True blocks normal assignment; set the derived field directly
+        object.__setattr__(self, "description_clean", desc.strip())
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Section:
     """Represents a grouping of related tasks within a phase.
 
@@ -44,21 +56,31 @@ class Section:
     tasks: list[Task]
     line_number: int
     purpose: str | None
+    # Lazy cache slot; slots=True removes __dict__ so it must be declared
+    _uncompleted_count: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def has_uncompleted_tasks(self) -> bool:
         """Return True if any task in section is not completed."""
-        return any(not task.completed for task in self.tasks)
+        return self.uncompleted_count() > 0
 
     def uncompleted_count(self) -> int:
-        """Return count of uncompleted tasks."""
-        return sum(1 for task in self.tasks if not task.completed)
+        """Return count of uncompleted tasks.
+
+        Computed once and cached: the task list is immutable after parsing and
+        the view modes re-query the same sections repeatedly.
+        """
+        cached = self._uncompleted_count
+        if cached is None:
+            cached = sum(1 for task in self.tasks if not task.completed)
+            object.__setattr__(self, "_uncompleted_count", cached)
+        return cached
 
     def total_count(self) -> int:
         """Return total number of tasks."""
         return len(self.tasks)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phase:
     """Represents a major development stage containing multiple sections.
 
@@ -73,21 +95,32 @@ class Phase:
     title: str
     sections: list[Section]
     line_number: int
+    # Lazy cache slots; slots=True removes __dict__ so they must be declared
+    _uncompleted_task_count: int | None = field(default=None, init=False, repr=False, compare=False)
+    _total_task_count: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def has_uncompleted_work(self) -> bool:
         """Return True if any section has uncompleted tasks."""
-        return any(section.has_uncompleted_tasks() for section in self.sections)
+        return self.uncompleted_task_count() > 0
 
     def uncompleted_task_count(self) -> int:
-        """Return total uncompleted tasks across all sections."""
-        return sum(section.uncompleted_count() for section in self.sections)
+        """Return total uncompleted tasks across all sections (cached)."""
+        cached = self._uncompleted_task_count
+        if cached is None:
+            cached = sum(section.uncompleted_count() for section in self.sections)
+            object.__setattr__(self, "_uncompleted_task_count", cached)
+        return cached
 
     def total_task_count(self) -> int:
-        """Return total tasks across all sections."""
-        return sum(section.total_count() for section in self.sections)
+        """Return total tasks across all sections (cached)."""
+        cached = self._total_task_count
+        if cached is None:
+            cached = sum(section.total_count() for section in self.sections)
+            object.__setattr__(self, "_total_task_count", cached)
+        return cached
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TasksFile:
     """Represents the entire parsed tasks.md file structure.
 
@@ -100,27 +133,100 @@ class TasksFile:
     file_path: Path
     phases: list[Phase]
     parse_errors: list["ParseError"]
+    # Lazy cache slots; slots=True removes __dict__ so they must be declared
+    _all_tasks: list[Task] | None = field(default=None, init=False, repr=False, compare=False)
+    _uncompleted_tasks: list[Task] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _task_index: dict[int, tuple[Phase, Section]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_task_context(self, task: Task) -> tuple[Phase, Section]:
+        """Return the (phase, section) containing the given task.
+
+        The index is keyed by line number (unique per task) and built once per
+        file with a single tree walk, then shared by every view rendered over
+        this TasksFile.
+
+        Args:
+            task: A task belonging to this file
+
+        Raises:
+            ValueError: If the task does not come from this file
+        """
+        index = self._task_index
+        if index is None:
+            index = {
+                task.line_number: (phase, section)
+                for phase in self.phases
+                for section in phase.sections
+                for task in section.tasks
+            }
+            object.__setattr__(self, "_task_index", index)
+
+        try:
+            return index[task.line_number]
+        except KeyError:
+            raise ValueError(f"Task {task.id} not found in tasks file") from None
 
     def get_all_tasks(self) -> list[Task]:
-        """Return flattened list of all tasks across all phases."""
-        return [
-            task for phase in self.phases for section in phase.sections for task in section.tasks
-        ]
-
-    def get_uncompleted_tasks(self) -> list[Task]:
-        """Return all uncompleted tasks in file order."""
-        return [task for task in self.get_all_tasks() if not task.completed]
+        """Return flattened list of all tasks across all phases.
+
+        The result is computed once and cached; the phase tree is immutable
+        after parsing, so repeated calls (one CLI invocation renders several
+        views over the same file) skip the full tree walk.
+        """
+        cached = self._all_tasks
+        if cached is None:
+            cached = [
+                task
+                for phase in self.phases
+                for section in phase.sections
+                for task in section.tasks
+            ]
+            # frozen=True blocks normal assignment; bypass for the cache slot
+            object.__setattr__(self, "_all_tasks", cached)
+        return cached
+
+    def get_uncompleted_tasks(self, limit: int | None = None) -> list[Task]:
+        """Return uncompleted tasks in file order (cached, see get_all_tasks).
+
+        Args:
+            limit: If given, return at most this many tasks; stops walking the
+                tree early instead of materializing the full filtered list.
+        """
+        cached = self._uncompleted_tasks
+        if cached is not None:
+            return cached if limit is None else cached[:limit]
+
+        uncompleted = (task for task in self.get_all_tasks() if not task.completed)
+        if limit is not None:
+            return list(islice(uncompleted, limit))
+
+        result = list(uncompleted)
+        object.__setattr__(self, "_uncompleted_tasks", result)
+        return result
 
     def get_phases_with_uncompleted_work(self) -> list[Phase]:
         """Return phases that have remaining work."""
         return [phase for phase in self.phases if phase.has_uncompleted_work()]
 
     def is_complete(self) -> bool:
-        """Return True if all tasks completed."""
-        return len(self.get_uncompleted_tasks()) == 0
+        """Return True if all tasks completed.
 
+        Short-circuits on the first uncompleted task instead of materializing
+        the full filtered list just to test emptiness.
+        """
+        return not any(
+            not task.completed
+            for phase in self.phases
+            for section in phase.sections
+            for task in section.tasks
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ParseError:
     """Represents a parsing error with context for debugging.
 
@@ -135,3 +241,8 @@ class ParseError:
     line_content: str
     error_type: str
     message: str
+
+    def __post_init__(self) -> None:
+        # error_type values form a small closed set; interning makes grouping
+        # and equality checks pointer comparisons
+        object.__setattr__(self, "error_type", sys.intern(self.error_type))
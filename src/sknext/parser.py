@@ -2,14 +2,108 @@
 
 Implements line-by-line state machine parsing to extract phases, sections, and tasks
 from speckit tasks.md files.
+
+The file is memory-mapped and matched as bytes: line boundaries are found by
+scanning for newlines in the mapped buffer, and UTF-8 decoding is deferred to
+the lines that actually match a pattern. This avoids materializing a list of
+decoded strings for the (typically dominant) share of lines the parser ignores.
 """
 
-import re
+import mmap
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
-from sknext.constants import PHASE_PATTERN, SECTION_PATTERN, TASK_PATTERN
+from sknext.constants import LINE_PATTERN_BYTES
 from sknext.models import ParseError, Phase, Section, Task, TasksFile
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Placeholder path recorded on TasksFile instances parsed from memory
+_STRING_PATH = Path("<string>")
+
+
+def _iter_lines(buffer: "mmap.mmap | bytes") -> Iterator[tuple[int, bytes]]:
+    """Yield (line_number, line_bytes) pairs without the trailing newline.
+
+    Works on any bytes-like buffer; with an mmap this slices pages lazily
+    instead of copying the whole file into a list of lines. A UTF-8 BOM is
+    skipped once here (it would otherwise hide a heading on line 1); CRLF
+    needs no per-line handling because the patterns' ``\\s*$`` anchor
+    absorbs a trailing CR.
+    """
+    start = 3 if buffer[:3] == _UTF8_BOM else 0
+    line_num = 0
+    size = len(buffer)
+    while start < size:
+        newline = buffer.find(b"\n", start)
+        if newline == -1:
+            newline = size
+        line_num += 1
+        yield line_num, bytes(buffer[start:newline])
+        start = newline + 1
+
+
+def _extract_markers(description: str) -> tuple[bool, str | None]:
+    """Find the [P] marker and first [USn] story tag in a single scan.
+
+    Replaces a containment check plus a regex search - two passes over every
+    description - with one left-to-right walk between '[' occurrences.
+    """
+    priority = False
+    story_tag: str | None = None
+    i = description.find("[")
+    while i != -1:
+        if not priority and description.startswith("[P]", i):
+            priority = True
+            i += 3
+        elif story_tag is None and description.startswith("[US", i):
+            end = description.find("]", i + 3)
+            digits = description[i + 3 : end] if end != -1 else ""
+            if digits.isdigit():
+                story_tag = "US" + digits
+                i = end + 1
+            else:
+                i += 1
+        else:
+            i += 1
+        if priority and story_tag is not None:
+            break
+        i = description.find("[", i)
+    return priority, story_tag
+
+
+def parse_tasks_string(content: str) -> TasksFile:
+    """Parse tasks.md content held in memory.
+
+    Runs the same state machine as :func:`parse_tasks_file` without touching
+    the filesystem or the stat-fingerprint cache; useful for tests and
+    callers that already hold the text.
+
+    Args:
+        content: The tasks.md text to parse
+
+    Returns:
+        TasksFile containing all phases, sections, tasks and any parse errors
+    """
+    return parse_tasks_bytes(content.encode("utf-8"))
+
+
+def parse_tasks_bytes(data: bytes) -> TasksFile:
+    """Parse raw tasks.md bytes held in memory.
+
+    The state machine natively works on bytes (decoding only matched
+    groups), so callers that already hold encoded content skip the
+    str round-trip entirely.
+
+    Args:
+        data: UTF-8 encoded tasks.md content
+
+    Returns:
+        TasksFile containing all phases, sections, tasks and any parse errors
+    """
+    return _parse_buffer(_STRING_PATH, data)
+
 
 def parse_tasks_file(file_path: Path) -> TasksFile:
     """Parse a tasks.md file and return structured representation.
@@ -23,12 +117,36 @@ def parse_tasks_file(file_path: Path) -> TasksFile:
     Raises:
         FileNotFoundError: If file_path does not exist
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    # Memoized per (path, mtime, size): repeated in-process invocations on an
+    # unchanged file (tests, library use) skip the re-parse entirely, and any
+    # write to the file changes the key. The path is resolved so relative
+    # paths used from different working directories cannot share an entry.
+    return _parse_cached(file_path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(file_path: Path, mtime_ns: int, size: int) -> TasksFile:
+    """Open, map and parse the file; cached on the stat fingerprint."""
+    with open(file_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped; parse the plain read instead.
+            # Only the constructor is guarded: UnicodeDecodeError is a
+            # ValueError subclass, so wrapping the parse itself would turn
+            # invalid UTF-8 into a silently empty result.
+            return _parse_buffer(file_path, f.read())
+        with mapped:
+            return _parse_buffer(file_path, mapped)
 
-    with open(file_path, encoding="utf-8") as f:
-        lines = f.readlines()
 
+def _parse_buffer(file_path: Path, buffer: "mmap.mmap | bytes") -> TasksFile:
+    """Run the state machine over a bytes buffer and build the TasksFile."""
     phases: list[Phase] = []
     parse_errors: list[ParseError] = []
 
@@ -37,68 +155,58 @@ def parse_tasks_file(file_path: Path) -> TasksFile:
     current_section: Section | None = None
     current_section_tasks: list[Task] = []
 
-    for line_num, line in enumerate(lines, start=1):
-        line = line.rstrip("\n")
+    for line_num, line in _iter_lines(buffer):
+        # Cheap first-byte gate: every matchable line starts with '#' or '-',
+        # and typical files are mostly blank/prose lines that can skip the
+        # regex engine entirely
+        first = line[:1]
+        if first != b"#" and first != b"-":
+            continue
+
+        # One regex pass per line: the fused alternation matches whichever of
+        # the three line shapes applies, and the filled group tells us which
+        match = LINE_PATTERN_BYTES.match(line)
+        if match is None:
+            continue
 
-        # Try to match phase header
-        phase_match = PHASE_PATTERN.match(line)
-        if phase_match:
-            # Save previous section if exists
+        if match.group("phase_number") is not None:
+            # Finalize previous section/phase; tasks and sections were
+            # accumulated directly into the instances' own lists, so no
+            # reconstruction is needed
             if current_section is not None:
-                current_phase_sections.append(
-                    Section(
-                        title=current_section.title,
-                        level=current_section.level,
-                        tasks=current_section_tasks,
-                        line_number=current_section.line_number,
-                        purpose=current_section.purpose,
-                    )
-                )
+                current_phase_sections.append(current_section)
                 current_section = None
                 current_section_tasks = []
 
-            # Save previous phase if exists
             if current_phase is not None:
-                phases.append(
-                    Phase(
-                        number=current_phase.number,
-                        title=current_phase.title,
-                        sections=current_phase_sections,
-                        line_number=current_phase.line_number,
-                    )
-                )
-                current_phase_sections = []
+                phases.append(current_phase)
+                preceding_sections: list[Section] = []
+            else:
+                # Sections seen before the first phase header belong to it
+                preceding_sections = current_phase_sections
 
-            # Start new phase
-            phase_number = int(phase_match.group("number"))
-            phase_title = phase_match.group("title").strip()
+            # Start new phase; alias the accumulator to the instance's list so
+            # sections land in place
+            phase_number = int(match.group("phase_number"))
+            # Captures are pre-trimmed by the pattern's whitespace anchoring
+            phase_title = match.group("phase_title").decode("utf-8")
             current_phase = Phase(
                 number=phase_number,
                 title=phase_title,
-                sections=[],
+                sections=preceding_sections,
                 line_number=line_num,
             )
+            current_phase_sections = current_phase.sections
             continue
 
-        # Try to match section header
-        section_match = SECTION_PATTERN.match(line)
-        if section_match:
-            # Save previous section if exists
+        if match.group("section_level") is not None:
+            # Finalize previous section if exists
             if current_section is not None:
-                current_phase_sections.append(
-                    Section(
-                        title=current_section.title,
-                        level=current_section.level,
-                        tasks=current_section_tasks,
-                        line_number=current_section.line_number,
-                        purpose=current_section.purpose,
-                    )
-                )
-                current_section_tasks = []
+                current_phase_sections.append(current_section)
 
-            # Start new section
-            section_level = len(section_match.group("level"))
-            section_title = section_match.group("title").strip()
+            # Start new section; alias the accumulator to the instance's list
+            section_level = len(match.group("section_level"))
+            section_title = match.group("section_title").decode("utf-8")
             current_section = Section(
                 title=section_title,
                 level=section_level,
@@ -106,11 +214,10 @@ def parse_tasks_file(file_path: Path) -> TasksFile:
                 line_number=line_num,
                 purpose=None,
             )
+            current_section_tasks = current_section.tasks
             continue
 
-        # Try to match task
-        task_match = TASK_PATTERN.match(line)
-        if task_match:
+        if match.group("task_id") is not None:
             # If we have a task but no section, create an implicit section
             if current_section is None and current_phase is not None:
                 current_section = Section(
@@ -120,22 +227,17 @@ def parse_tasks_file(file_path: Path) -> TasksFile:
                     line_number=line_num,
                     purpose=None,
                 )
+                current_section_tasks = current_section.tasks
 
-            checkbox = task_match.group("checkbox")
-            task_id = task_match.group("task_id")
-            description = task_match.group("description").strip()
+            checkbox = match.group("checkbox")
+            task_id = match.group("task_id").decode("ascii")
+            description = match.group("description").decode("utf-8")
 
             # Determine if task is completed (non-space character in checkbox)
-            completed = checkbox != " "
-
-            # Extract priority marker [P]
-            priority = "[P]" in description
+            completed = checkbox != b" "
 
-            # Extract story tag [USX]
-            story_tag = None
-            story_match = re.search(r"\[US(\d+)\]", description)
-            if story_match:
-                story_tag = f"US{story_match.group(1)}"
+            # Extract [P] priority marker and [USX] story tag in one scan
+            priority, story_tag = _extract_markers(description)
 
             task = Task(
                 id=task_id,
@@ -144,33 +246,16 @@ def parse_tasks_file(file_path: Path) -> TasksFile:
                 priority=priority,
                 story_tag=story_tag,
                 line_number=line_num,
-                raw_line=line,
             )
             current_section_tasks.append(task)
             continue
 
-    # Save final section if exists
+    # Save final section and phase if they exist
     if current_section is not None:
-        current_phase_sections.append(
-            Section(
-                title=current_section.title,
-                level=current_section.level,
-                tasks=current_section_tasks,
-                line_number=current_section.line_number,
-                purpose=current_section.purpose,
-            )
-        )
+        current_phase_sections.append(current_section)
 
-    # Save final phase if exists
     if current_phase is not None:
-        phases.append(
-            Phase(
-                number=current_phase.number,
-                title=current_phase.title,
-                sections=current_phase_sections,
-                line_number=current_phase.line_number,
-            )
-        )
+        phases.append(current_phase)
 
     return TasksFile(
         file_path=file_path,
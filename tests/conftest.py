@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from sknext.discovery import clear_discovery_caches
+
+
+@pytest.fixture(autouse=True)
+def _clear_discovery_caches():
+    """Keep cached discovery lookups from leaking between tests."""
+    clear_discovery_caches()
@@ -1,16 +1,53 @@
 """Integration tests for CLI."""
 
+import io
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+
 import pytest
-from typer.testing import CliRunner
 
-from sknext.cli import app
+from sknext.cli import main
+
+
+@dataclass
+class Result:
+    """Captured outcome of an in-process CLI invocation."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def invoke(args: list) -> Result:
+    """Run the CLI in-process and capture its output and exit code."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            main([str(arg) for arg in args])
+        except SystemExit as exc:
+            if isinstance(exc.code, int):
+                exit_code = exc.code
+            elif exc.code is not None:
+                exit_code = 1
+    return Result(exit_code, stdout.getvalue(), stderr.getvalue())
+
 
-runner = CliRunner()
+@pytest.fixture(autouse=True)
+def wide_console(monkeypatch):
+    """Keep rich from wrapping long tmp paths in captured (non-tty) output."""
+    monkeypatch.setenv("COLUMNS", "200")
 
 
-@pytest.fixture
-def sample_workspace(tmp_path):
-    """Create a sample workspace with tasks.md."""
+@pytest.fixture(scope="module")
+def sample_workspace(tmp_path_factory):
+    """Create a sample workspace with tasks.md.
+
+    Module-scoped: the workspace is read-only for every test using it, so one
+    tmpdir and one write amortize across the whole module.
+    """
+    tmp_path = tmp_path_factory.mktemp("workspace")
     specs_dir = tmp_path / "specs"
     specs_dir.mkdir()
     feature_dir = specs_dir / "001-test-feature"
@@ -51,7 +88,7 @@ def test_cli_default_view(sample_workspace):
     """Test CLI with default view (no args)."""
     workspace, tasks_file = sample_workspace
 
-    result = runner.invoke(app, [str(tasks_file)])
+    result = invoke([tasks_file])
 
     assert result.exit_code == 0
     assert "Phase 1" in result.stdout
@@ -65,7 +102,7 @@ def test_cli_auto_discovery(sample_workspace, monkeypatch):
 
     # Change to workspace directory
     monkeypatch.chdir(workspace)
-    result = runner.invoke(app, [])
+    result = invoke([])
 
     assert result.exit_code == 0
     assert "Found:" in result.stdout
@@ -76,7 +113,7 @@ def test_cli_custom_count(sample_workspace):
     """Test CLI with custom count option."""
     workspace, tasks_file = sample_workspace
 
-    result = runner.invoke(app, [str(tasks_file), "-n", "3"])
+    result = invoke([tasks_file, "-n", "3"])
 
     assert result.exit_code == 0
     # Should show exactly 3 tasks
@@ -87,7 +124,7 @@ def test_cli_count_zero(sample_workspace):
     """Test CLI with count=0 (Easter Egg: shows 1 task with humorous message)."""
     workspace, tasks_file = sample_workspace
 
-    result = runner.invoke(app, [str(tasks_file), "-n", "0"])
+    result = invoke([tasks_file, "-n", "0"])
 
     assert result.exit_code == 0
     # Easter Egg: Should show exactly 1 task (first uncompleted = T002) with special message
@@ -98,32 +135,30 @@ def test_cli_count_zero(sample_workspace):
 
 def test_cli_file_not_found():
     """Test CLI with non-existent file."""
-    result = runner.invoke(app, ["/nonexistent/tasks.md"])
+    result = invoke(["/nonexistent/tasks.md"])
 
-    # Exit code 2 is from typer's validation error for nonexistent file
-    # Typer writes to stderr, not stdout
+    # Exit code 2 is from argument validation for nonexistent file
+    # The parser writes to stderr, not stdout
     assert result.exit_code == 2
 
 
-def test_cli_empty_file():
+def test_cli_empty_file(tmp_path, monkeypatch):
     """Test CLI with empty tasks.md file."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create empty file
-        with open("tasks.md", "w") as f:
-            f.write("")
+    monkeypatch.chdir(tmp_path)
+    # Create empty file
+    (tmp_path / "tasks.md").write_text("")
 
-        result = runner.invoke(app, ["tasks.md"])
+    result = invoke(["tasks.md"])
 
-        # Should succeed with completion message
-        assert result.exit_code == 0
-        assert "complete" in result.stdout.lower() or "no" in result.stdout.lower()
+    # Should succeed with completion message
+    assert result.exit_code == 0
+    assert "complete" in result.stdout.lower() or "no" in result.stdout.lower()
 
 
 def test_cli_missing_specs_directory(tmp_path, monkeypatch):
     """Test CLI auto-discovery when specs/ doesn't exist."""
     monkeypatch.chdir(tmp_path)
-    result = runner.invoke(app, [])
+    result = invoke([])
 
     assert result.exit_code == 1
     assert "Error" in result.stdout
@@ -149,7 +184,7 @@ def test_cli_shows_completion_message(tmp_path):
     tasks_file = feature_dir / "tasks.md"
     tasks_file.write_text(tasks_content)
 
-    result = runner.invoke(app, [str(tasks_file)])
+    result = invoke([tasks_file])
 
     assert result.exit_code == 0
     assert "complete" in result.stdout.lower() or "✓" in result.stdout
@@ -174,7 +209,7 @@ def test_cli_with_priority_tasks(tmp_path):
     tasks_file = feature_dir / "tasks.md"
     tasks_file.write_text(tasks_content)
 
-    result = runner.invoke(app, [str(tasks_file)])
+    result = invoke([tasks_file])
 
     assert result.exit_code == 0
     assert "[P]" in result.stdout
@@ -200,227 +235,104 @@ def test_cli_with_story_tags(tmp_path):
     tasks_file = feature_dir / "tasks.md"
     tasks_file.write_text(tasks_content)
 
-    result = runner.invoke(app, [str(tasks_file)])
+    result = invoke([tasks_file])
 
     assert result.exit_code == 0
     assert "[US1]" in result.stdout
     assert "T001" in result.stdout
 
 
-def test_cli_phases_only():
-    """Test CLI with --phases-only flag."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a tasks.md with multiple phases
-        content = """# Tasks
+@pytest.fixture(scope="module")
+def view_mode_workspace(tmp_path_factory):
+    """Shared read-only multi-phase workspace for the view-mode matrix."""
+    tmp_path = tmp_path_factory.mktemp("view-modes")
+    content = """# Tasks
 
 ## Phase 1: Complete Phase
 
-### Section A
-- [X] T001 Done task
-
-## Phase 2: Incomplete Phase
-
-### Section B
-- [ ] T002 Todo task
-- [ ] T003 Another task
-
-## Phase 3: Another Incomplete
-
-### Section C
-- [ ] T004 More work
-"""
-        with open("tasks.md", "w") as f:
-            f.write(content)
-
-        result = runner.invoke(app, ["tasks.md", "--phases-only"])
-
-        assert result.exit_code == 0
-        # Should show phase headings
-        assert "Phase 2" in result.stdout
-        assert "Phase 3" in result.stdout
-        # Should NOT show completed Phase 1
-        assert "Phase 1" not in result.stdout or "Complete Phase" not in result.stdout
-        # Should NOT show sections or tasks
-        assert "Section B" not in result.stdout
-        assert "Section C" not in result.stdout
-        assert "T002" not in result.stdout
-        assert "T003" not in result.stdout
-        assert "T004" not in result.stdout
-
-
-def test_cli_structure():
-    """Test CLI with --structure flag."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a tasks.md with phases and sections
-        content = """# Tasks
-
-## Phase 1: Setup
-
-### Complete Section
+### Done Section
 - [X] T001 Done task
 
-### Incomplete Section A
-- [ ] T002 Todo task
-
-## Phase 2: Implementation
-
-### Incomplete Section B
-- [ ] T003 More work
-- [ ] T004 Even more
-"""
-        with open("tasks.md", "w") as f:
-            f.write(content)
-
-        result = runner.invoke(app, ["tasks.md", "--structure"])
-
-        assert result.exit_code == 0
-        # Should show phases
-        assert "Phase 1" in result.stdout
-        assert "Phase 2" in result.stdout
-        # Should show incomplete sections
-        assert "Incomplete Section A" in result.stdout
-        assert "Incomplete Section B" in result.stdout
-        # Should NOT show completed section
-        assert "Complete Section" not in result.stdout
-        # Should NOT show tasks
-        assert "T002" not in result.stdout
-        assert "T003" not in result.stdout
-        assert "T004" not in result.stdout
-
-
-def test_cli_all_phases():
-    """Test CLI with --all-phases flag."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a tasks.md with multiple phases
-        content = """# Tasks
-
-## Phase 1: Complete Phase
-
-### Section
-- [X] T001 Done
-
 ## Phase 2: Incomplete Phase A
 
-### Section A
+### Incomplete Section A
 - [ ] T002 First task
 - [ ] T003 Second task
 
 ## Phase 3: Incomplete Phase B
 
-### Section B
+### Incomplete Section B
 - [ ] T004 Third task
 - [ ] T005 Fourth task
 """
-        with open("tasks.md", "w") as f:
-            f.write(content)
-
-        result = runner.invoke(app, ["tasks.md", "--all-phases", "-n", "2"])
-
-        assert result.exit_code == 0
-        # Should show all incomplete phases
-        assert "Phase 2" in result.stdout
-        assert "Phase 3" in result.stdout
-        # Should NOT show complete phase
-        assert "Phase 1" not in result.stdout or "Complete Phase" not in result.stdout
-        # Should show limited tasks (only 2)
-        assert "T002" in result.stdout
-        assert "T003" in result.stdout
-        # Should NOT show T004, T005 (beyond count)
-        assert "T004" not in result.stdout
-        assert "T005" not in result.stdout
-        # Should have separator or "Next tasks" header
-        assert "next" in result.stdout.lower() or "incomplete" in result.stdout.lower()
-
-
-def test_cli_conflicting_flags():
-    """Test CLI rejects conflicting view mode flags."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        with open("tasks.md", "w") as f:
-            f.write("# Tasks\n\n## Phase 1: Test\n### Section\n- [ ] T001 Task\n")
-
-        # Multiple view flags should work - last one wins or first match wins
-        # Our current implementation uses if/elif so first match wins
-        result = runner.invoke(app, ["tasks.md", "--phases-only", "--structure"])
-        # Should succeed - phases-only takes precedence
-        assert result.exit_code == 0
-
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text(content)
+    return tasks_file
+
+
+@pytest.mark.parametrize(
+    ("flags", "expected", "forbidden"),
+    [
+        pytest.param(
+            ["--phases-only"],
+            ["Phase 2", "Phase 3"],
+            # No completed phase, no sections, no tasks
+            ["Complete Phase", "Incomplete Section A", "Incomplete Section B", "T002", "T004"],
+            id="phases-only",
+        ),
+        pytest.param(
+            ["--structure"],
+            ["Phase 2", "Phase 3", "Incomplete Section A", "Incomplete Section B"],
+            # No completed phase/section, no tasks
+            ["Complete Phase", "Done Section", "T002", "T003", "T004"],
+            id="structure",
+        ),
+        pytest.param(
+            ["--all-phases", "-n", "2"],
+            # All incomplete phases, then the first 2 tasks
+            ["Phase 2", "Phase 3", "T002", "T003", "Next"],
+            ["Complete Phase", "T004", "T005"],
+            id="all-phases",
+        ),
+        pytest.param(
+            ["--tasks-only", "-n", "3"],
+            ["T002", "T003", "T004"],
+            # No task beyond the count, no phase or section headings
+            ["T005", "Phase 2", "Phase 3", "Incomplete Section A", "Incomplete Section B"],
+            id="tasks-only",
+        ),
+        pytest.param(
+            ["--all"],
+            # Every uncompleted task plus the "all remaining" summary
+            ["T002", "T003", "T004", "T005", "all"],
+            ["T001"],
+            id="all",
+        ),
+    ],
+)
+def test_cli_view_modes(view_mode_workspace, flags, expected, forbidden):
+    """Test each view-mode flag against one shared multi-phase workspace."""
+    result = invoke([view_mode_workspace, *flags])
 
-def test_cli_tasks_only():
-    """Test CLI with --tasks-only flag."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a tasks.md with phases and sections
-        content = """# Tasks
-
-## Phase 1: Setup
-
-### Section A
-- [ ] T001 First task
-- [ ] T002 Second task
-
-## Phase 2: Implementation
-
-### Section B
-- [ ] T003 Third task
-- [ ] T004 Fourth task
-"""
-        with open("tasks.md", "w") as f:
-            f.write(content)
-
-        result = runner.invoke(app, ["tasks.md", "--tasks-only", "-n", "3"])
-
-        assert result.exit_code == 0
-        # Should show tasks
-        assert "T001" in result.stdout
-        assert "T002" in result.stdout
-        assert "T003" in result.stdout
-        # Should NOT show T004 (beyond count)
-        assert "T004" not in result.stdout
-        # Should NOT show phase or section headings
-        assert "Phase 1" not in result.stdout
-        assert "Phase 2" not in result.stdout
-        assert "Section A" not in result.stdout
-        assert "Section B" not in result.stdout
-
-
-def test_cli_all():
-    """Test CLI with --all flag."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a tasks.md with many tasks
-        content = """# Tasks
-
-## Phase 1: Setup
-
-### Section A
-- [ ] T001 Task 1
-- [ ] T002 Task 2
-- [ ] T003 Task 3
-
-## Phase 2: Implementation
-
-### Section B
-- [ ] T004 Task 4
-- [ ] T005 Task 5
-"""
-        with open("tasks.md", "w") as f:
-            f.write(content)
+    assert result.exit_code == 0
+    for text in expected:
+        assert text in result.stdout, f"expected {text!r} in output"
+    for text in forbidden:
+        assert text not in result.stdout, f"unexpected {text!r} in output"
 
-        result = runner.invoke(app, ["tasks.md", "--all"])
 
-        assert result.exit_code == 0
-        # Should show all tasks
-        assert "T001" in result.stdout
-        assert "T002" in result.stdout
-        assert "T003" in result.stdout
-        assert "T004" in result.stdout
-        assert "T005" in result.stdout
-        # Should show "all" in summary
-        assert "all" in result.stdout.lower() or "5" in result.stdout
+def test_cli_conflicting_flags(tmp_path, monkeypatch):
+    """Test CLI rejects conflicting view mode flags."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "tasks.md").write_text(
+        "# Tasks\n\n## Phase 1: Test\n### Section\n- [ ] T001 Task\n"
+    )
+
+    # Multiple view flags should work - last one wins or first match wins
+    # Our current implementation uses if/elif so first match wins
+    result = invoke(["tasks.md", "--phases-only", "--structure"])
+    # Should succeed - phases-only takes precedence
+    assert result.exit_code == 0
 
 
 # User Story 1 Integration Tests: Subdirectory Support
@@ -439,7 +351,7 @@ def test_from_subdirectory_git_repo(tmp_path):
     subdir.mkdir(parents=True)
 
     # Run from subdirectory
-    result = runner.invoke(app, [], catch_exceptions=False)
+    result = invoke([])
 
     # Note: This will currently fail because CLI doesn't use find_repository_root yet
     # Will pass after T021-T023 implementation
@@ -459,7 +371,7 @@ def test_from_repo_root_unchanged(tmp_path, monkeypatch):
 """)
 
     monkeypatch.chdir(tmp_path)
-    result = runner.invoke(app, [])
+    result = invoke([])
 
     assert result.exit_code == 0
     assert "T001" in result.stdout or "T002" in result.stdout or "Task 1" in result.stdout
@@ -0,0 +1,31 @@
+"""Fixtures shared by the unit tests."""
+
+import pytest
+
+from sknext.parser import parse_tasks_string
+
+_HIERARCHY_MD = """# Tasks: Test
+
+## Phase 1: Setup
+
+### Section A
+
+- [ ] T001 Task A1
+- [ ] T002 Task A2
+
+### Section B
+
+- [ ] T003 Task B1
+
+## Phase 2: Implementation
+
+### Section C
+
+- [ ] T004 Task C1
+"""
+
+
+@pytest.fixture(scope="session")
+def hierarchy_result():
+    """Parse the two-phase corpus once and share it across structural tests."""
+    return parse_tasks_string(_HIERARCHY_MD)
@@ -147,16 +147,16 @@ def test_discover_handles_three_digit_padding(tmp_path):
 def test_find_git_root_success(tmp_path):
     """Test git command returns repository root."""
     with patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(stdout="/repo/path\n")
+        mock_run.return_value = MagicMock(stdout=b"/repo/path\n")
         result = find_git_root(tmp_path)
         assert result == Path("/repo/path")
         mock_run.assert_called_once_with(
             ["git", "rev-parse", "--show-toplevel"],
             cwd=tmp_path,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=True,
-            timeout=2.0,
+            timeout=0.5,
         )
 
 
@@ -184,8 +184,8 @@ def test_find_git_root_timeout(tmp_path):
         assert result is None
 
 
-def test_find_repository_root_git_priority(tmp_path):
-    """Test git command has priority over filesystem search."""
+def test_find_repository_root_git_beats_specs_fallback(tmp_path):
+    """Test the git command wins over the specs/ fallback when no marker is found."""
     (tmp_path / "specs").mkdir()
 
     with patch("sknext.discovery.find_git_root") as mock_git:
@@ -194,6 +194,26 @@ def test_find_repository_root_git_priority(tmp_path):
         assert result == tmp_path / "git-root"
 
 
+def test_find_repository_root_marker_first(tmp_path):
+    """Test a local VCS marker answers detection without ever invoking git."""
+    (tmp_path / ".git").mkdir()
+
+    with patch("subprocess.run") as mock_run:
+        result = find_repository_root(tmp_path)
+        assert result == tmp_path
+        mock_run.assert_not_called()
+
+
+def test_find_repository_root_env_override(tmp_path, monkeypatch):
+    """Test SKNEXT_REPO_ROOT short-circuits detection without any probe."""
+    monkeypatch.setenv("SKNEXT_REPO_ROOT", str(tmp_path))
+
+    with patch("subprocess.run") as mock_run:
+        result = find_repository_root(tmp_path / "anywhere")
+        assert result == tmp_path
+        mock_run.assert_not_called()
+
+
 # User Story 2 Tests: Multi-Repository Workspace
 
 
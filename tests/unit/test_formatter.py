@@ -1,9 +1,8 @@
 """Tests for formatter module."""
 
-import re
-from io import StringIO
 from pathlib import Path
 
+import pytest
 from rich.console import Console
 
 from sknext.formatter import (
@@ -15,51 +14,97 @@ from sknext.formatter import (
 )
 from sknext.models import Phase, Section, Task, TasksFile
 
+# Built once at import: Task is frozen, so tests can safely share instances
+_SAMPLE_TASKS = (
+    Task("T001", "First task", False, False, None, 10),
+    Task("T002", "Second task", False, False, None, 11),
+    Task("T003", "Third task", False, True, None, 12),
+    Task("T004", "Fourth task", False, False, "US1", 13),
+    Task("T005", "Fifth task", False, False, None, 14),
+)
+
+_FAKE_PATH = Path("/tmp/test.md")
 
-def strip_ansi(text: str) -> str:
-    """Strip ANSI color codes from text."""
-    ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-    return ansi_escape.sub("", text)
+_TASKS_20 = tuple(Task(f"T{i:03d}", f"Task {i}", False, False, None, i * 10) for i in range(1, 21))
 
 
 def create_sample_tasks() -> list[Task]:
     """Helper to create sample tasks."""
-    return [
-        Task("T001", "First task", False, False, None, 10, "- [ ] T001 First task"),
-        Task("T002", "Second task", False, False, None, 11, "- [ ] T002 Second task"),
-        Task("T003", "Third task", False, True, None, 12, "- [ ] T003 [P] Third task"),
-        Task("T004", "Fourth task", False, False, "US1", 13, "- [ ] T004 [US1] Fourth task"),
-        Task("T005", "Fifth task", False, False, None, 14, "- [ ] T005 Fifth task"),
-    ]
+    return list(_SAMPLE_TASKS)
+
+
+class _ChunkSink:
+    """Append-only text sink for Console output.
+
+    StringIO reallocates its internal buffer geometrically under Rich's many
+    small writes; collecting chunks in a list and joining on read sidesteps
+    that entirely.
+    """
+
+    __slots__ = ("chunks",)
+
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.chunks.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self.chunks)
 
 
-def test_format_default_view_basic():
+@pytest.fixture(scope="module")
+def _console_and_buffer():
+    """One Console per module: capability detection and theme load happen once."""
+    output = _ChunkSink()
+    return Console(file=output, width=100, no_color=True, force_terminal=False), output
+
+
+@pytest.fixture
+def rich_console(_console_and_buffer):
+    """Yield the shared (console, output) pair with the buffer reset."""
+    console, output = _console_and_buffer
+    output.chunks.clear()
+    return console, output
+
+
+@pytest.fixture(scope="module")
+def make_tasks_file():
+    """Build the common 1-phase/1-section TasksFile around a task list."""
+
+    def _mk(tasks, *, phase_num=1, phase_name="Setup", section_name="Test Section"):
+        section = Section(section_name, 3, tasks, 5, None)
+        phase = Phase(phase_num, phase_name, [section], 3)
+        return TasksFile(_FAKE_PATH, [phase], [])
+
+    return _mk
+
+
+def test_format_default_view_basic(rich_console, make_tasks_file):
     """Test basic default view formatting."""
     tasks = create_sample_tasks()[:2]
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=2)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     assert "Phase 1: Setup" in result
     assert "Test Section" in result
     assert "T001" in result
     assert "T002" in result
 
 
-def test_format_default_view_respects_count():
+def test_format_default_view_respects_count(rich_console, make_tasks_file):
     """Test that default view respects count parameter."""
     tasks = create_sample_tasks()
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=3)
 
     result = output.getvalue()
@@ -71,15 +116,12 @@ def test_format_default_view_respects_count():
     assert "T005" not in result
 
 
-def test_format_default_view_shows_summary():
+def test_format_default_view_shows_summary(rich_console, make_tasks_file):
     """Test that default view shows summary line."""
     tasks = create_sample_tasks()
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=2)
 
     result = output.getvalue()
@@ -89,20 +131,17 @@ def test_format_default_view_shows_summary():
     assert "remaining" in result
 
 
-def test_format_default_view_handles_completed_tasks():
+def test_format_default_view_handles_completed_tasks(rich_console, make_tasks_file):
     """Test that default view only shows uncompleted tasks."""
     tasks = [
-        Task("T001", "Done", True, False, None, 10, "- [X] T001 Done"),
-        Task("T002", "Todo", False, False, None, 11, "- [ ] T002 Todo"),
-        Task("T003", "Also done", True, False, None, 12, "- [X] T003 Also done"),
-        Task("T004", "Also todo", False, False, None, 13, "- [ ] T004 Also todo"),
+        Task("T001", "Done", True, False, None, 10),
+        Task("T002", "Todo", False, False, None, 11),
+        Task("T003", "Also done", True, False, None, 12),
+        Task("T004", "Also todo", False, False, None, 13),
     ]
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=10)
 
     result = output.getvalue()
@@ -112,32 +151,28 @@ def test_format_default_view_handles_completed_tasks():
     assert "Done" not in result or "T001" not in result
 
 
-def test_format_default_view_shows_phase_context():
+def test_format_default_view_shows_phase_context(rich_console, make_tasks_file):
     """Test that tasks are shown with phase context."""
-    tasks = [Task("T001", "Task", False, False, None, 10, "- [ ] T001 Task")]
-    section = Section("Implementation", 3, tasks, 5, None)
-    phase = Phase(2, "Foundation", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "Task", False, False, None, 10)]
+    tasks_file = make_tasks_file(
+        tasks, phase_num=2, phase_name="Foundation", section_name="Implementation"
+    )
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=1)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show phase heading
     assert "Phase 2" in result
     assert "Foundation" in result
 
 
-def test_format_default_view_shows_section_context():
+def test_format_default_view_shows_section_context(rich_console, make_tasks_file):
     """Test that tasks are shown with section context."""
-    tasks = [Task("T001", "Task", False, False, None, 10, "- [ ] T001 Task")]
-    section = Section("Parser Implementation", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "Task", False, False, None, 10)]
+    tasks_file = make_tasks_file(tasks, section_name="Parser Implementation")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=1)
 
     result = output.getvalue()
@@ -145,18 +180,15 @@ def test_format_default_view_shows_section_context():
     assert "Parser Implementation" in result
 
 
-def test_format_default_view_all_complete():
+def test_format_default_view_all_complete(rich_console, make_tasks_file):
     """Test default view when all tasks are complete."""
     tasks = [
-        Task("T001", "Done 1", True, False, None, 10, "- [X] T001 Done 1"),
-        Task("T002", "Done 2", True, False, None, 11, "- [X] T002 Done 2"),
+        Task("T001", "Done 1", True, False, None, 10),
+        Task("T002", "Done 2", True, False, None, 11),
     ]
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=10)
 
     result = output.getvalue()
@@ -164,18 +196,15 @@ def test_format_default_view_all_complete():
     assert "complete" in result.lower() or "done" in result.lower()
 
 
-def test_format_default_view_count_exceeds_available():
+def test_format_default_view_count_exceeds_available(rich_console, make_tasks_file):
     """Test default view when count exceeds available tasks."""
     tasks = [
-        Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1"),
-        Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
+        Task("T001", "Task 1", False, False, None, 10),
+        Task("T002", "Task 2", False, False, None, 11),
     ]
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=100)
 
     result = output.getvalue()
@@ -184,20 +213,19 @@ def test_format_default_view_count_exceeds_available():
     assert "T002" in result
 
 
-def test_format_default_view_multiple_phases():
+def test_format_default_view_multiple_phases(rich_console):
     """Test default view with tasks spanning multiple phases."""
-    tasks1 = [Task("T001", "Phase 1 task", False, False, None, 10, "- [ ] T001 Phase 1 task")]
+    tasks1 = [Task("T001", "Phase 1 task", False, False, None, 10)]
     section1 = Section("Section 1", 3, tasks1, 5, None)
     phase1 = Phase(1, "Setup", [section1], 3)
 
-    tasks2 = [Task("T002", "Phase 2 task", False, False, None, 20, "- [ ] T002 Phase 2 task")]
+    tasks2 = [Task("T002", "Phase 2 task", False, False, None, 20)]
     section2 = Section("Section 2", 3, tasks2, 18, None)
     phase2 = Phase(2, "Implementation", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=5)
 
     result = output.getvalue()
@@ -206,18 +234,15 @@ def test_format_default_view_multiple_phases():
     assert "Phase 2" in result
 
 
-def test_format_default_view_easter_egg_zero_count():
+def test_format_default_view_easter_egg_zero_count(rich_console, make_tasks_file):
     """Test Easter Egg: count=0 shows 1 task with humorous message."""
     tasks = create_sample_tasks()
-    section = Section("Test Section", 3, tasks, 5, None)
-    phase = Phase(1, "Setup", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks)
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_default_view(console, tasks_file, count=0)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show exactly 1 task
     assert "T001" in result
     assert "T002" not in result
@@ -228,23 +253,22 @@ def test_format_default_view_easter_egg_zero_count():
 # Tests for format_phases_only
 
 
-def test_format_phases_only_shows_only_phases():
+def test_format_phases_only_shows_only_phases(rich_console):
     """Test phases-only view shows only phase headings."""
-    tasks1 = [Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1")]
+    tasks1 = [Task("T001", "Task 1", False, False, None, 10)]
     section1 = Section("Section A", 3, tasks1, 5, None)
     phase1 = Phase(1, "Setup", [section1], 3)
 
-    tasks2 = [Task("T002", "Task 2", False, False, None, 20, "- [ ] T002 Task 2")]
+    tasks2 = [Task("T002", "Task 2", False, False, None, 20)]
     section2 = Section("Section B", 3, tasks2, 18, None)
     phase2 = Phase(2, "Implementation", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_phases_only(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show phase headings
     assert "Phase 1: Setup" in result
     assert "Phase 2: Implementation" in result
@@ -255,42 +279,38 @@ def test_format_phases_only_shows_only_phases():
     assert "T002" not in result
 
 
-def test_format_phases_only_filters_completed_phases():
+def test_format_phases_only_filters_completed_phases(rich_console):
     """Test phases-only view only shows phases with uncompleted work."""
     # Phase 1: all complete
-    tasks1 = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
+    tasks1 = [Task("T001", "Done", True, False, None, 10)]
     section1 = Section("Section A", 3, tasks1, 5, None)
     phase1 = Phase(1, "Complete Phase", [section1], 3)
 
     # Phase 2: has uncompleted
-    tasks2 = [Task("T002", "Todo", False, False, None, 20, "- [ ] T002 Todo")]
+    tasks2 = [Task("T002", "Todo", False, False, None, 20)]
     section2 = Section("Section B", 3, tasks2, 18, None)
     phase2 = Phase(2, "Incomplete Phase", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_phases_only(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should only show incomplete phase
     assert "Phase 2: Incomplete Phase" in result
     assert "Complete Phase" not in result or "Phase 1" not in result
 
 
-def test_format_phases_only_all_complete():
+def test_format_phases_only_all_complete(rich_console, make_tasks_file):
     """Test phases-only view when all phases are complete."""
-    tasks = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Complete", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "Done", True, False, None, 10)]
+    tasks_file = make_tasks_file(tasks, phase_name="Complete", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_phases_only(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show completion message
     assert "complete" in result.lower() or "✓" in result
 
@@ -298,22 +318,21 @@ def test_format_phases_only_all_complete():
 # Tests for format_structure_view
 
 
-def test_format_structure_view_shows_phases_and_sections():
+def test_format_structure_view_shows_phases_and_sections(rich_console):
     """Test structure view shows phases and sections but not tasks."""
-    tasks1 = [Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1")]
+    tasks1 = [Task("T001", "Task 1", False, False, None, 10)]
     section1 = Section("Section A", 3, tasks1, 5, None)
 
-    tasks2 = [Task("T002", "Task 2", False, False, None, 15, "- [ ] T002 Task 2")]
+    tasks2 = [Task("T002", "Task 2", False, False, None, 15)]
     section2 = Section("Section B", 3, tasks2, 13, None)
 
     phase = Phase(1, "Setup", [section1, section2], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_structure_view(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show phase and sections
     assert "Phase 1: Setup" in result
     assert "Section A" in result
@@ -323,65 +342,60 @@ def test_format_structure_view_shows_phases_and_sections():
     assert "T002" not in result
 
 
-def test_format_structure_view_filters_completed_sections():
+def test_format_structure_view_filters_completed_sections(rich_console):
     """Test structure view only shows sections with uncompleted tasks."""
     # Section 1: all complete
-    tasks1 = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
+    tasks1 = [Task("T001", "Done", True, False, None, 10)]
     section1 = Section("Complete Section", 3, tasks1, 5, None)
 
     # Section 2: has uncompleted
-    tasks2 = [Task("T002", "Todo", False, False, None, 20, "- [ ] T002 Todo")]
+    tasks2 = [Task("T002", "Todo", False, False, None, 20)]
     section2 = Section("Incomplete Section", 3, tasks2, 18, None)
 
     phase = Phase(1, "Phase", [section1, section2], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_structure_view(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should only show incomplete section
     assert "Incomplete Section" in result
     assert "Complete Section" not in result
 
 
-def test_format_structure_view_filters_completed_phases():
+def test_format_structure_view_filters_completed_phases(rich_console):
     """Test structure view only shows phases with uncompleted work."""
     # Phase 1: all complete
-    tasks1 = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
+    tasks1 = [Task("T001", "Done", True, False, None, 10)]
     section1 = Section("Section", 3, tasks1, 5, None)
     phase1 = Phase(1, "Complete Phase", [section1], 3)
 
     # Phase 2: has uncompleted
-    tasks2 = [Task("T002", "Todo", False, False, None, 20, "- [ ] T002 Todo")]
+    tasks2 = [Task("T002", "Todo", False, False, None, 20)]
     section2 = Section("Section", 3, tasks2, 18, None)
     phase2 = Phase(2, "Incomplete Phase", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_structure_view(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should only show incomplete phase
     assert "Phase 2: Incomplete Phase" in result
     assert "Complete Phase" not in result or "Phase 1" not in result
 
 
-def test_format_structure_view_all_complete():
+def test_format_structure_view_all_complete(rich_console, make_tasks_file):
     """Test structure view when all work is complete."""
-    tasks = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Complete", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "Done", True, False, None, 10)]
+    tasks_file = make_tasks_file(tasks, phase_name="Complete", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_structure_view(console, tasks_file)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show completion message
     assert "complete" in result.lower() or "✓" in result
 
@@ -389,28 +403,27 @@ def test_format_structure_view_all_complete():
 # Tests for format_combined_view
 
 
-def test_format_combined_view_shows_phases_and_tasks():
+def test_format_combined_view_shows_phases_and_tasks(rich_console):
     """Test combined view shows all incomplete phases followed by N tasks."""
     # Phase 1 with tasks
     tasks1 = [
-        Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1"),
-        Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
+        Task("T001", "Task 1", False, False, None, 10),
+        Task("T002", "Task 2", False, False, None, 11),
     ]
     section1 = Section("Section A", 3, tasks1, 5, None)
     phase1 = Phase(1, "Phase One", [section1], 3)
 
     # Phase 2 with tasks
-    tasks2 = [Task("T003", "Task 3", False, False, None, 20, "- [ ] T003 Task 3")]
+    tasks2 = [Task("T003", "Task 3", False, False, None, 20)]
     section2 = Section("Section B", 3, tasks2, 18, None)
     phase2 = Phase(2, "Phase Two", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_combined_view(console, tasks_file, count=2)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show phase headings
     assert "Phase 1: Phase One" in result
     assert "Phase 2: Phase Two" in result
@@ -423,64 +436,57 @@ def test_format_combined_view_shows_phases_and_tasks():
     assert "next" in result.lower() and "tasks" in result.lower()
 
 
-def test_format_combined_view_respects_count():
+def test_format_combined_view_respects_count(rich_console, make_tasks_file):
     """Test combined view respects task count limit."""
     tasks = [
-        Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1"),
-        Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-        Task("T003", "Task 3", False, False, None, 12, "- [ ] T003 Task 3"),
+        Task("T001", "Task 1", False, False, None, 10),
+        Task("T002", "Task 2", False, False, None, 11),
+        Task("T003", "Task 3", False, False, None, 12),
     ]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Phase", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks, phase_name="Phase", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_combined_view(console, tasks_file, count=1)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should only show 1 task
     assert "T001" in result
     assert "T002" not in result
     assert "T003" not in result
 
 
-def test_format_combined_view_filters_completed_phases():
+def test_format_combined_view_filters_completed_phases(rich_console):
     """Test combined view only shows incomplete phases."""
     # Completed phase
-    tasks1 = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
+    tasks1 = [Task("T001", "Done", True, False, None, 10)]
     section1 = Section("Section", 3, tasks1, 5, None)
     phase1 = Phase(1, "Complete Phase", [section1], 3)
 
     # Incomplete phase
-    tasks2 = [Task("T002", "Todo", False, False, None, 20, "- [ ] T002 Todo")]
+    tasks2 = [Task("T002", "Todo", False, False, None, 20)]
     section2 = Section("Section", 3, tasks2, 18, None)
     phase2 = Phase(2, "Incomplete Phase", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_combined_view(console, tasks_file, count=5)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should only show incomplete phase
     assert "Phase 2: Incomplete Phase" in result
     assert "Complete Phase" not in result or "Phase 1" not in result
 
 
-def test_format_combined_view_all_complete():
+def test_format_combined_view_all_complete(rich_console, make_tasks_file):
     """Test combined view when all work is complete."""
-    tasks = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Complete", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "Done", True, False, None, 10)]
+    tasks_file = make_tasks_file(tasks, phase_name="Complete", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_combined_view(console, tasks_file, count=10)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show completion message
     assert "complete" in result.lower() or "✓" in result
 
@@ -488,26 +494,25 @@ def test_format_combined_view_all_complete():
 # Tests for format_tasks_only
 
 
-def test_format_tasks_only_shows_only_tasks():
+def test_format_tasks_only_shows_only_tasks(rich_console):
     """Test tasks-only view shows only task lines."""
     tasks1 = [
-        Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1"),
-        Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
+        Task("T001", "Task 1", False, False, None, 10),
+        Task("T002", "Task 2", False, False, None, 11),
     ]
     section1 = Section("Section A", 3, tasks1, 5, None)
     phase1 = Phase(1, "Phase One", [section1], 3)
 
-    tasks2 = [Task("T003", "Task 3", False, False, None, 20, "- [ ] T003 Task 3")]
+    tasks2 = [Task("T003", "Task 3", False, False, None, 20)]
     section2 = Section("Section B", 3, tasks2, 18, None)
     phase2 = Phase(2, "Phase Two", [section2], 16)
 
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase1, phase2], [])
+    tasks_file = TasksFile(_FAKE_PATH, [phase1, phase2], [])
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_tasks_only(console, tasks_file, count=3)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show tasks
     assert "T001" in result
     assert "T002" in result
@@ -519,59 +524,48 @@ def test_format_tasks_only_shows_only_tasks():
     assert "Section B" not in result
 
 
-def test_format_tasks_only_respects_count():
+def test_format_tasks_only_respects_count(rich_console, make_tasks_file):
     """Test tasks-only view respects count limit."""
     tasks = [
-        Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1"),
-        Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-        Task("T003", "Task 3", False, False, None, 12, "- [ ] T003 Task 3"),
+        Task("T001", "Task 1", False, False, None, 10),
+        Task("T002", "Task 2", False, False, None, 11),
+        Task("T003", "Task 3", False, False, None, 12),
     ]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Phase", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks_file = make_tasks_file(tasks, phase_name="Phase", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_tasks_only(console, tasks_file, count=2)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should only show 2 tasks
     assert "T001" in result
     assert "T002" in result
     assert "T003" not in result
 
 
-def test_format_tasks_only_handles_priority():
+def test_format_tasks_only_handles_priority(rich_console, make_tasks_file):
     """Test tasks-only view preserves priority markers."""
-    tasks = [
-        Task("T001", "[P] Priority task", False, True, None, 10, "- [ ] T001 [P] Priority task")
-    ]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Phase", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "[P] Priority task", False, True, None, 10)]
+    tasks_file = make_tasks_file(tasks, phase_name="Phase", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_tasks_only(console, tasks_file, count=5)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show priority marker
     assert "T001" in result
     assert "[P]" in result or "P" in result
 
 
-def test_format_tasks_only_all_complete():
+def test_format_tasks_only_all_complete(rich_console, make_tasks_file):
     """Test tasks-only view when all tasks are complete."""
-    tasks = [Task("T001", "Done", True, False, None, 10, "- [X] T001 Done")]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Complete", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = [Task("T001", "Done", True, False, None, 10)]
+    tasks_file = make_tasks_file(tasks, phase_name="Complete", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     format_tasks_only(console, tasks_file, count=10)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show completion message
     assert "complete" in result.lower() or "✓" in result
 
@@ -579,22 +573,16 @@ def test_format_tasks_only_all_complete():
 # Tests for --all flag (shows all tasks with context)
 
 
-def test_format_all_tasks_shows_all():
+def test_format_all_tasks_shows_all(rich_console, make_tasks_file):
     """Test that we can show all tasks by passing large count to default view."""
-    tasks = [
-        Task(f"T{i:03d}", f"Task {i}", False, False, None, i * 10, f"- [ ] T{i:03d} Task {i}")
-        for i in range(1, 21)  # 20 tasks
-    ]
-    section = Section("Section", 3, tasks, 5, None)
-    phase = Phase(1, "Phase", [section], 3)
-    tasks_file = TasksFile(Path("/tmp/test.md"), [phase], [])
+    tasks = list(_TASKS_20)
+    tasks_file = make_tasks_file(tasks, phase_name="Phase", section_name="Section")
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=100)
+    console, output = rich_console
     # Use default view with very large count
     format_default_view(console, tasks_file, count=1000)
 
-    result = strip_ansi(output.getvalue())
+    result = output.getvalue()
     # Should show all tasks
     assert "T001" in result
     assert "T020" in result
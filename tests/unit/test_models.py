@@ -2,69 +2,54 @@
 
 from pathlib import Path
 
+import pytest
+
 from sknext.models import ParseError, Phase, Section, Task, TasksFile
 
 
+def _task(tid: str, done: bool = False) -> Task:
+    """Build a minimal Task; only the id and completion state vary here."""
+    return Task(tid, f"Task {tid}", done, False, None, 0)
+
+
+def _phase(number: int, groups: list[list[tuple[str, bool]]]) -> Phase:
+    """Build a Phase with one Section per group of (task_id, done) specs."""
+    sections = [
+        Section(f"Sec {i}", 3, [_task(tid, done) for tid, done in group], 0, None)
+        for i, group in enumerate(groups, start=1)
+    ]
+    return Phase(number, "Test", sections, 0)
+
+
 class TestTask:
     """Tests for Task dataclass."""
 
-    def test_task_creation(self):
-        """Test creating a valid task."""
+    @pytest.mark.parametrize(
+        ("tid", "description", "done", "pri", "story"),
+        [
+            pytest.param("T001", "Create project structure", False, False, None, id="plain"),
+            pytest.param("T002", "[P] Parallel task", False, True, None, id="priority"),
+            pytest.param("T003", "[US1] User story task", False, False, "US1", id="story-tag"),
+            pytest.param("T004", "Completed task", True, False, None, id="completed"),
+        ],
+    )
+    def test_task_creation(self, tid, description, done, pri, story):
+        """Test creating tasks across the marker/completion matrix."""
         task = Task(
-            id="T001",
-            description="Create project structure",
-            completed=False,
-            priority=False,
-            story_tag=None,
+            id=tid,
+            description=description,
+            completed=done,
+            priority=pri,
+            story_tag=story,
             line_number=10,
-            raw_line="- [ ] T001 Create project structure",
         )
-        assert task.id == "T001"
-        assert task.description == "Create project structure"
-        assert not task.completed
-        assert not task.priority
-        assert task.story_tag is None
+        assert task.id == tid
+        assert task.description == description
+        assert task.completed == done
+        assert task.priority == pri
+        assert task.story_tag == story
         assert task.line_number == 10
 
-    def test_task_with_priority(self):
-        """Test task with priority marker."""
-        task = Task(
-            id="T002",
-            description="[P] Parallel task",
-            completed=False,
-            priority=True,
-            story_tag=None,
-            line_number=15,
-            raw_line="- [ ] T002 [P] Parallel task",
-        )
-        assert task.priority
-
-    def test_task_with_story_tag(self):
-        """Test task with story tag."""
-        task = Task(
-            id="T003",
-            description="[US1] User story task",
-            completed=False,
-            priority=False,
-            story_tag="US1",
-            line_number=20,
-            raw_line="- [ ] T003 [US1] User story task",
-        )
-        assert task.story_tag == "US1"
-
-    def test_completed_task(self):
-        """Test completed task."""
-        task = Task(
-            id="T004",
-            description="Completed task",
-            completed=True,
-            priority=False,
-            story_tag=None,
-            line_number=25,
-            raw_line="- [X] T004 Completed task",
-        )
-        assert task.completed
-
 
 class TestSection:
     """Tests for Section dataclass."""
@@ -85,40 +70,26 @@ class TestSection:
 
     def test_section_with_tasks(self):
         """Test section containing tasks."""
-        tasks = [
-            Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1"),
-            Task("T002", "Task 2", True, False, None, 11, "- [X] T002 Task 2"),
-            Task("T003", "Task 3", False, False, None, 12, "- [ ] T003 Task 3"),
-        ]
+        tasks = [_task("T001"), _task("T002", done=True), _task("T003")]
         section = Section("Implementation", 3, tasks, 8, None)
         assert len(section.tasks) == 3
         assert section.total_count() == 3
 
     def test_section_has_uncompleted_tasks(self):
         """Test section.has_uncompleted_tasks() method."""
-        tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-        ]
+        tasks = [_task("T001", done=True), _task("T002")]
         section = Section("Test", 3, tasks, 5, None)
         assert section.has_uncompleted_tasks()
 
     def test_section_all_completed(self):
         """Test section with all completed tasks."""
-        tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", True, False, None, 11, "- [X] T002 Task 2"),
-        ]
+        tasks = [_task("T001", done=True), _task("T002", done=True)]
         section = Section("Test", 3, tasks, 5, None)
         assert not section.has_uncompleted_tasks()
 
     def test_section_uncompleted_count(self):
         """Test section.uncompleted_count() method."""
-        tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-            Task("T003", "Task 3", False, False, None, 12, "- [ ] T003 Task 3"),
-        ]
+        tasks = [_task("T001", done=True), _task("T002"), _task("T003")]
         section = Section("Test", 3, tasks, 5, None)
         assert section.uncompleted_count() == 2
 
@@ -144,48 +115,22 @@ class TestPhase:
 
     def test_phase_has_uncompleted_work(self):
         """Test phase.has_uncompleted_work() method."""
-        tasks = [Task("T001", "Task", False, False, None, 10, "- [ ] T001 Task")]
-        section = Section("Test", 3, tasks, 8, None)
-        phase = Phase(1, "Test", [section], 5)
+        phase = _phase(1, [[("T001", False)]])
         assert phase.has_uncompleted_work()
 
     def test_phase_all_completed(self):
         """Test phase with all work completed."""
-        tasks = [Task("T001", "Task", True, False, None, 10, "- [X] T001 Task")]
-        section = Section("Test", 3, tasks, 8, None)
-        phase = Phase(1, "Test", [section], 5)
+        phase = _phase(1, [[("T001", True)]])
         assert not phase.has_uncompleted_work()
 
     def test_phase_uncompleted_task_count(self):
         """Test phase.uncompleted_task_count() method."""
-        section1_tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-        ]
-        section2_tasks = [
-            Task("T003", "Task 3", False, False, None, 15, "- [ ] T003 Task 3"),
-        ]
-        sections = [
-            Section("Sec 1", 3, section1_tasks, 8, None),
-            Section("Sec 2", 3, section2_tasks, 13, None),
-        ]
-        phase = Phase(1, "Test", sections, 5)
+        phase = _phase(1, [[("T001", True), ("T002", False)], [("T003", False)]])
         assert phase.uncompleted_task_count() == 2
 
     def test_phase_total_task_count(self):
         """Test phase.total_task_count() method."""
-        section1_tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-        ]
-        section2_tasks = [
-            Task("T003", "Task 3", False, False, None, 15, "- [ ] T003 Task 3"),
-        ]
-        sections = [
-            Section("Sec 1", 3, section1_tasks, 8, None),
-            Section("Sec 2", 3, section2_tasks, 13, None),
-        ]
-        phase = Phase(1, "Test", sections, 5)
+        phase = _phase(1, [[("T001", True), ("T002", False)], [("T003", False)]])
         assert phase.total_task_count() == 3
 
 
@@ -201,18 +146,7 @@ class TestTasksFile:
 
     def test_get_all_tasks(self):
         """Test TasksFile.get_all_tasks() method."""
-        section1_tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-        ]
-        section2_tasks = [
-            Task("T003", "Task 3", False, False, None, 15, "- [ ] T003 Task 3"),
-        ]
-        sections = [
-            Section("Sec 1", 3, section1_tasks, 8, None),
-            Section("Sec 2", 3, section2_tasks, 13, None),
-        ]
-        phase = Phase(1, "Test", sections, 5)
+        phase = _phase(1, [[("T001", True), ("T002", False)], [("T003", False)]])
         tasks_file = TasksFile(Path("/tmp/tasks.md"), [phase], [])
 
         all_tasks = tasks_file.get_all_tasks()
@@ -220,30 +154,17 @@ class TestTasksFile:
 
     def test_get_uncompleted_tasks(self):
         """Test TasksFile.get_uncompleted_tasks() method."""
-        section_tasks = [
-            Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1"),
-            Task("T002", "Task 2", False, False, None, 11, "- [ ] T002 Task 2"),
-            Task("T003", "Task 3", False, False, None, 12, "- [ ] T003 Task 3"),
-        ]
-        section = Section("Test", 3, section_tasks, 8, None)
-        phase = Phase(1, "Test", [section], 5)
+        phase = _phase(1, [[("T001", True), ("T002", False), ("T003", False)]])
         tasks_file = TasksFile(Path("/tmp/tasks.md"), [phase], [])
 
         uncompleted = tasks_file.get_uncompleted_tasks()
-        assert len(uncompleted) == 2
-        assert all(not task.completed for task in uncompleted)
+        # One list-equality check pins down content and ordering at once
+        assert uncompleted == phase.sections[0].tasks[1:]
 
     def test_get_phases_with_uncompleted_work(self):
         """Test TasksFile.get_phases_with_uncompleted_work() method."""
-        # Phase 1: all completed
-        phase1_tasks = [Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1")]
-        phase1_section = Section("Sec", 3, phase1_tasks, 8, None)
-        phase1 = Phase(1, "Complete", [phase1_section], 5)
-
-        # Phase 2: has uncompleted
-        phase2_tasks = [Task("T002", "Task 2", False, False, None, 15, "- [ ] T002 Task 2")]
-        phase2_section = Section("Sec", 3, phase2_tasks, 13, None)
-        phase2 = Phase(2, "In Progress", [phase2_section], 12)
+        phase1 = _phase(1, [[("T001", True)]])
+        phase2 = _phase(2, [[("T002", False)]])
 
         tasks_file = TasksFile(Path("/tmp/tasks.md"), [phase1, phase2], [])
         uncompleted_phases = tasks_file.get_phases_with_uncompleted_work()
@@ -252,18 +173,12 @@ class TestTasksFile:
 
     def test_is_complete(self):
         """Test TasksFile.is_complete() method."""
-        completed_tasks = [Task("T001", "Task 1", True, False, None, 10, "- [X] T001 Task 1")]
-        section = Section("Sec", 3, completed_tasks, 8, None)
-        phase = Phase(1, "Test", [section], 5)
-        tasks_file = TasksFile(Path("/tmp/tasks.md"), [phase], [])
+        tasks_file = TasksFile(Path("/tmp/tasks.md"), [_phase(1, [[("T001", True)]])], [])
         assert tasks_file.is_complete()
 
     def test_is_not_complete(self):
         """Test TasksFile.is_complete() returns False when tasks remain."""
-        tasks = [Task("T001", "Task 1", False, False, None, 10, "- [ ] T001 Task 1")]
-        section = Section("Sec", 3, tasks, 8, None)
-        phase = Phase(1, "Test", [section], 5)
-        tasks_file = TasksFile(Path("/tmp/tasks.md"), [phase], [])
+        tasks_file = TasksFile(Path("/tmp/tasks.md"), [_phase(1, [[("T001", False)]])], [])
         assert not tasks_file.is_complete()
 
 